@@ -39,6 +39,16 @@ TRENDING_SYSTEM_PROMPT = """You are a news trend analyst. Given a cluster of art
 
 Return ONLY valid JSON matching this exact schema. No markdown, no code fences."""
 
+BATCH_INSTRUCTIONS = """
+
+You will receive several numbered news clusters. Analyze EACH cluster independently and return a JSON object with a single key "results" containing an array with one object per cluster, in the same order, each matching the schema above plus a "cluster" key holding the cluster's number.
+
+Return ONLY valid JSON. No markdown, no code fences."""
+
+# Output budget for batched calls grows with the number of clusters asked for
+BATCH_TOKENS_PER_CLUSTER = 600
+BATCH_MAX_TOKENS = 8192
+
 CHAT_SYSTEM_PROMPT = """You are a helpful news assistant for AiON, an AI-powered news platform. You are answering questions about a specific news article.
 
 Article context:
@@ -91,6 +101,7 @@ class AIRouter:
 
     - summarize_cluster() -> Claude (primary) -> OpenAI (fallback) -> deterministic
     - analyze_trending()  -> OpenAI (primary) -> Claude (fallback) -> deterministic
+      (summarize_clusters() / analyze_trending_batch() do the same for many clusters per call)
     - explain_story()     -> Perplexity (primary) -> OpenAI (fallback) -> Claude (fallback) -> deterministic
     """
 
@@ -184,6 +195,76 @@ class AIRouter:
             "ai_provider": "none",
         }
 
+    async def summarize_clusters(
+        self, batch: list[tuple[list[str], list[str], list[str]]]
+    ) -> list[Optional[AISummaryResponse]]:
+        """Summarize several clusters with one call per provider attempt.
+
+        Each item is (titles, snippets, sources). Results come back in input
+        order. Clusters the primary provider misses are retried on the
+        fallback; any still missing are None, so the caller can leave them
+        for a later run. With no AI provider configured the deterministic
+        summary is used, as in summarize_cluster().
+        Primary: Claude. Fallback: OpenAI.
+        """
+        if not batch:
+            return []
+        providers = [
+            ("anthropic", self.settings.anthropic_key, self._anthropic_chat),
+            ("openai", self.settings.openai_key, self._openai_chat),
+        ]
+        if not any(key for _, key, _ in providers):
+            logger.info("Batch summary generated by deterministic fallback")
+            return [self._fallback_summary(*item) for item in batch]
+        results, _ = await self._try_batch_providers(
+            SUMMARY_SYSTEM_PROMPT + BATCH_INSTRUCTIONS,
+            batch,
+            providers,
+            "summary",
+            lambda item: AISummaryResponse(**item),
+        )
+        return results
+
+    async def analyze_trending_batch(
+        self, batch: list[tuple[list[str], list[str], list[str]]]
+    ) -> list[dict]:
+        """Trending analysis for several clusters with one call per provider attempt.
+
+        Same item shape and ordering as summarize_clusters(); each result has
+        the keys analyze_trending() returns. Clusters no provider answers get
+        the deterministic result.
+        Primary: OpenAI. Fallback: Claude -> deterministic.
+        """
+        if not batch:
+            return []
+        providers = [
+            ("openai", self.settings.openai_key, self._openai_chat),
+            ("anthropic", self.settings.anthropic_key, self._anthropic_chat),
+        ]
+        items, used = await self._try_batch_providers(
+            TRENDING_SYSTEM_PROMPT + BATCH_INSTRUCTIONS, batch, providers, "trending", _require_dict
+        )
+
+        results = []
+        for item, provider, (_, _, sources) in zip(items, used, batch):
+            if item is not None:
+                results.append({
+                    "why_trending": item.get("why_trending", ""),
+                    "tags": item.get("tags", []),
+                    "sentiment": item.get("sentiment", "neutral"),
+                    "impact_score": item.get("impact_score", 5),
+                    "ai_provider": provider,
+                })
+            else:
+                results.append({
+                    "why_trending": f"Covered by {len(set(sources))} sources" if sources else "",
+                    "tags": [],
+                    "sentiment": "neutral",
+                    "impact_score": 5,
+                    "ai_provider": "none",
+                })
+        return results
+
     async def explain_story(
         self, title: str, snippet: str, source: str
     ) -> ExplainResponse:
@@ -455,6 +536,47 @@ class AIRouter:
         logger.warning(f"All translation providers failed for {target_language}")
         return None
 
+    async def _try_batch_providers(
+        self, system_prompt: str, batch: list, providers: list, task: str, parse
+    ) -> tuple[list, list[Optional[str]]]:
+        """Try providers in order for a batched prompt, per cluster.
+
+        Each provider is only asked for the clusters earlier ones left
+        unanswered; parse(item) turns a result into the returned value and
+        raises if it is unusable. Returns (results, provider names), aligned
+        with batch and None where every provider failed.
+        """
+        results: list = [None] * len(batch)
+        used: list[Optional[str]] = [None] * len(batch)
+        for name, key, chat in providers:
+            pending = [i for i, r in enumerate(results) if r is None]
+            if not pending:
+                break
+            if not key:
+                continue
+            sub = [batch[i] for i in pending]
+            max_tokens = min(BATCH_MAX_TOKENS, BATCH_TOKENS_PER_CLUSTER * len(sub))
+            try:
+                result = await chat(system_prompt, self._build_batch_prompt(sub), max_tokens=max_tokens)
+                items = self._parse_ai_json(result, name).get("results", [])
+            except Exception as e:
+                logger.warning(f"{name} batch {task} failed: {e}")
+                continue
+            answered = 0
+            for n, item in _align_batch_items(items, len(sub)).items():
+                try:
+                    results[pending[n]] = parse(item)
+                except Exception:
+                    continue
+                used[pending[n]] = name
+                answered += 1
+            logger.info(f"Batch {task} generated by {name} ({answered}/{len(sub)} clusters)")
+
+        missing = results.count(None)
+        if missing:
+            logger.warning(f"Batch {task}: no provider answered {missing}/{len(batch)} clusters")
+        return results, used
+
     # ── Multi-turn helpers ─────────────────────────────────────────
 
     async def _anthropic_chat_multi(self, system: str, messages: list[dict]) -> str:
@@ -509,6 +631,18 @@ class AIRouter:
             parts.append(f"[{i+1}] {src}: {t}\n   {s or '(no snippet)'}")
         return "Analyze this news cluster:\n\n" + "\n\n".join(parts)
 
+    def _build_batch_prompt(
+        self, batch: list[tuple[list[str], list[str], list[str]]]
+    ) -> str:
+        parts = []
+        for n, (titles, snippets, sources) in enumerate(batch):
+            articles = "\n".join(
+                f"  [{i+1}] {src}: {t}\n      {s or '(no snippet)'}"
+                for i, (t, s, src) in enumerate(zip(titles, snippets, sources))
+            )
+            parts.append(f"Cluster {n+1}:\n{articles}")
+        return f"Analyze these {len(batch)} news clusters:\n\n" + "\n\n".join(parts)
+
     def _parse_ai_json(self, text: str, model_type: str) -> dict:
         """Parse JSON from AI response, handling common formatting issues."""
         text = text.strip()
@@ -615,6 +749,30 @@ class AIRouter:
         )
 
 
+def _require_dict(item) -> dict:
+    if not isinstance(item, dict):
+        raise TypeError(f"expected an object, got {type(item).__name__}")
+    return item
+
+
+def _align_batch_items(items: list, count: int) -> dict[int, object]:
+    """Map batch results to 0-based cluster positions.
+
+    Uses each result's "cluster" number when every result has one, so a
+    short or reordered reply still lands on the right clusters; otherwise
+    falls back to list order, but only when the count matches.
+    """
+    if items and all(isinstance(it, dict) and isinstance(it.get("cluster"), int) for it in items):
+        aligned: dict[int, object] = {}
+        for it in items:
+            if 1 <= it["cluster"] <= count:
+                aligned.setdefault(it["cluster"] - 1, it)
+        return aligned
+    if len(items) == count:
+        return dict(enumerate(items))
+    return {}
+
+
 # Singleton
 _ai_router: Optional[AIRouter] = None
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime
 
 from sqlalchemy import (
@@ -15,18 +16,71 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    bindparam,
+    exists,
     func,
+    literal_column,
+    select,
+    text,
+    update,
 )
+from sqlalchemy.dialects import postgresql  # noqa: F401 — registers to_tsvector() & co.
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.schema import SetColumnComment
 
 from apps.api.config import get_settings
+from packages.shared.schemas import ARTICLE_HASH_SCHEME, make_article_hash
+
+logger = logging.getLogger("aion.database")
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def simple_tsvector(column):
+    """``to_tsvector('simple', column)`` — must match the GIN index expression."""
+    return func.to_tsvector(literal_column("'simple'"), column)
+
+
+_PG_TRGM_INSTALLED = text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+
+# Set by init_db; similarity() only exists once pg_trgm is installed
+_pg_trgm_enabled = False
+
+
+def pg_trgm_enabled() -> bool:
+    """Whether trigram functions such as similarity() can be used in queries."""
+    return _pg_trgm_enabled
+
+
+def _has_pg_trgm(ddl, target, bind, **kw) -> bool:
+    """Trigram indexes need pg_trgm; skip them if init_db couldn't enable it."""
+    if bind is None:  # compiling DDL to a string, no database to ask
+        return True
+    return bool(bind.scalar(_PG_TRGM_INSTALLED))
+
+
+def _search_indexes(table: str, name: str, column) -> tuple[Index, Index]:
+    """Full-text and trigram GIN indexes for a title column (Postgres only)."""
+    return (
+        Index(
+            f"ix_{table}_title_fts",
+            simple_tsvector(column),
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            f"ix_{table}_title_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={name: "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        ).ddl_if(dialect="postgresql", callable_=_has_pg_trgm),
+    )
+
+
 # ── Models ───────────────────────────────────────────────────────
 class Article(Base):
     __tablename__ = "articles"
@@ -44,15 +98,22 @@ class Article(Base):
     raw_snippet = Column(Text)
     image_url = Column(Text)
     cluster_id = Column(Integer, ForeignKey("clusters.cluster_id"), nullable=True)
-    hash = Column(String(32), unique=True, nullable=False)
+    hash = Column(String(32), unique=True, nullable=False, comment=ARTICLE_HASH_SCHEME)
     embedding = Column(JSON, nullable=True)  # [float, ...] from text-embedding-3-small (256 dims)
     metadata_json = Column(JSON, default=dict)
 
     __table_args__ = (
         Index("ix_articles_hash", "hash"),
         Index("ix_articles_country_category", "country", "category"),
-        Index("ix_articles_published", "published_at"),
+        # Covering index: newest-first listings can be index-only scans
+        Index(
+            "ix_articles_published_covering",
+            published_at.desc(),
+            postgresql_include=["id", "title", "source", "category", "image_url", "cluster_id"],
+            postgresql_concurrently=True,
+        ),
         Index("ix_articles_cluster", "cluster_id"),
+        *_search_indexes("articles", "title", title),
     )
 
 
@@ -73,12 +134,19 @@ class Cluster(Base):
     metadata_json = Column(JSON, default=dict)  # sentiment, impact_score, ai_providers
     last_updated = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    claimed_at = Column(DateTime(timezone=True), nullable=True)  # enrich worker lease
 
     articles = relationship("Article", backref="cluster", lazy="selectin")
 
     __table_args__ = (
-        Index("ix_clusters_score", "score"),
+        Index(
+            "ix_clusters_score_covering",
+            score.desc(),
+            postgresql_include=["cluster_id", "canonical_title", "top_category", "last_updated"],
+            postgresql_concurrently=True,
+        ),
         Index("ix_clusters_country_category", "top_country", "top_category"),
+        *_search_indexes("clusters", "canonical_title", canonical_title),
     )
 
 
@@ -145,6 +213,8 @@ class Notification(Base):
     __table_args__ = (
         Index("ix_notifications_user", "user_id"),
         Index("ix_notifications_user_unread", "user_id", "is_read"),
+        # One notification per user per article; inserts skip duplicates
+        Index("uq_notifications_user_article", "user_id", "article_id", unique=True),
     )
 
 
@@ -169,8 +239,8 @@ def get_engine():
         _engine = create_async_engine(
             _ensure_async_url(settings.database_url),
             echo=False,
-            pool_size=10,
-            max_overflow=20,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
             pool_pre_ping=True,
         )
     return _engine
@@ -191,11 +261,166 @@ async def get_db() -> AsyncSession:
         yield session
 
 
+# Rows that would violate uq_notifications_user_article on databases created
+# before it existed (overlapping notify runs could insert the same pair twice).
+# Run once, under init_db's migration lock, only while that index is missing.
+_DEDUPE_NOTIFICATIONS = text(
+    "DELETE FROM notifications a USING notifications b "
+    "WHERE a.user_id = b.user_id AND a.article_id = b.article_id AND a.id > b.id"
+)
+
+
+# Columns added to existing tables since they were created (create_all only
+# creates missing tables)
+_ADD_MISSING_COLUMNS = [
+    text("ALTER TABLE clusters ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMPTZ"),
+]
+
+
+_REHASH_BATCH = 1000
+
+
+async def _rehash_articles(conn) -> int:
+    """Recompute articles.hash with the current make_article_hash.
+
+    Rows whose new hash is already taken keep their old one: they are older
+    copies of an article that was re-inserted under the new scheme.
+    """
+    articles = Article.__table__
+    other = articles.alias("other")
+    stmt = (
+        update(articles)
+        .where(articles.c.id == bindparam("row_id"))
+        .where(~exists().where(other.c.hash == bindparam("new_hash")))
+        .values(hash=bindparam("new_hash"))
+    )
+    rehashed = 0
+    last_id = 0
+    while True:
+        result = await conn.execute(
+            select(articles.c.id, articles.c.title, articles.c.source, articles.c.hash)
+            .where(articles.c.id > last_id)
+            .order_by(articles.c.id)
+            .limit(_REHASH_BATCH)
+        )
+        rows = result.all()
+        if not rows:
+            return rehashed
+        last_id = rows[-1].id
+        params = []
+        for row in rows:
+            # Sources are whitespace-stripped on ingest (ArticleCreate)
+            new_hash = make_article_hash(row.title, row.source.strip())
+            if new_hash != row.hash:
+                params.append({"row_id": row.id, "new_hash": new_hash})
+        if params:
+            await conn.execute(stmt, params)
+            rehashed += len(params)
+
+
+async def _article_hash_scheme(conn):
+    return await conn.scalar(text(
+        "SELECT col_description('articles'::regclass, attnum) FROM pg_attribute "
+        "WHERE attrelid = 'articles'::regclass AND attname = 'hash'"
+    ))
+
+
+# Indexes superseded by the covering ones above; databases created before the
+# switch still have them, and every write would keep maintaining both
+_DROP_REPLACED_INDEXES = [
+    text("DROP INDEX IF EXISTS ix_articles_published"),
+    text("DROP INDEX IF EXISTS ix_clusters_score"),
+]
+
+
+# A CREATE INDEX CONCURRENTLY that fails (or is interrupted) leaves an
+# invalid index behind, which checkfirst would then treat as present
+_INVALID_INDEXES = text(
+    "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+)
+
+
+async def _drop_invalid_indexes(conn):
+    names = [index.name for table in Base.metadata.sorted_tables for index in table.indexes]
+    for name in (await conn.scalars(_INVALID_INDEXES, {"names": names})).all():
+        logger.warning("Rebuilding invalid index %s", name)
+        await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+
+def _create_missing_indexes(sync_conn):
+    """create_all skips indexes on tables that already exist; add them here.
+
+    On Postgres the large ones are built CONCURRENTLY (see their
+    postgresql_concurrently flag), so this must run outside a transaction.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+# pg_advisory_lock key (arbitrary, app-wide): the API and the worker both run
+# init_db at boot, and its one-shot migrations must not run twice at once
+_MIGRATION_LOCK_KEY = 0x41694F4E
+
+
 async def init_db():
-    """Create all tables."""
+    """Create all tables and any indexes added since they were created."""
     engine = get_engine()
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if engine.dialect.name != "postgresql":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_create_missing_indexes)
+            for stmt in _DROP_REPLACED_INDEXES:
+                await conn.execute(stmt)
+        return
+
+    # Autocommit, so each step (and each rehash batch) commits on its own
+    # rather than holding locks on articles for the whole migration, and so
+    # indexes can be built CONCURRENTLY without blocking writes; the
+    # session-level advisory lock serializes concurrent boots instead
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(select(func.pg_advisory_lock(_MIGRATION_LOCK_KEY)))
+        try:
+            await _migrate_postgres(conn)
+        finally:
+            await conn.execute(select(func.pg_advisory_unlock(_MIGRATION_LOCK_KEY)))
+
+
+async def _migrate_postgres(conn):
+    """Postgres schema setup and one-shot migrations; caller holds the lock."""
+    global _pg_trgm_enabled
+    try:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except Exception as e:
+        logger.warning("Could not enable pg_trgm (%s) — skipping trigram indexes", e)
+    _pg_trgm_enabled = bool(await conn.scalar(_PG_TRGM_INSTALLED))
+
+    await conn.run_sync(Base.metadata.create_all)
+    for stmt in _ADD_MISSING_COLUMNS:
+        await conn.execute(stmt)
+    # One-shot: stored hashes predate the current scheme, so dedup
+    # would miss every article already in the table
+    if await _article_hash_scheme(conn) != ARTICLE_HASH_SCHEME:
+        rehashed = await _rehash_articles(conn)
+        await conn.execute(SetColumnComment(Article.__table__.c.hash))
+        logger.info(
+            "Recomputed article hashes as %s (%d rows differed)",
+            ARTICLE_HASH_SCHEME, rehashed,
+        )
+    await _drop_invalid_indexes(conn)
+    # Checked after invalid indexes are dropped, so a failed earlier build of
+    # the unique index is deduped and retried too; the lock keeps a second
+    # process from deleting rows while this one builds it
+    has_unique = await conn.scalar(
+        text("SELECT to_regclass('uq_notifications_user_article') IS NOT NULL")
+    )
+    if not has_unique:
+        await conn.execute(_DEDUPE_NOTIFICATIONS)
+    await conn.run_sync(_create_missing_indexes)
+    for stmt in _DROP_REPLACED_INDEXES:
+        await conn.execute(stmt)
 
 
 async def close_db():
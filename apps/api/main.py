@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -11,16 +10,14 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from apps.api.config import get_settings
 from apps.api.database import init_db, close_db
+from apps.api.logging_config import configure_logging
 from apps.api.middleware.caching import ETagMiddleware
 from apps.api.redis_client import close_redis
 from apps.api.routes import auth, chat, feed, health, heygen, meta, notifications, preferences, search, story, stream, translate, visa
+from apps.api.services import embeddings, heygen as heygen_service, visa as visa_service
 
 # ── Logging ──────────────────────────────────────────────────────
-logging.basicConfig(
-    level=logging.INFO,
-    format='{"time":"%(asctime)s","level":"%(levelname)s","logger":"%(name)s","msg":"%(message)s"}',
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+configure_logging()
 logger = logging.getLogger("aion")
 
 
@@ -31,6 +28,9 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
     yield
+    await embeddings.close_client()
+    await heygen_service.close_client()
+    await visa_service.close_client()
     await close_db()
     await close_redis()
     logger.info("AiON API shut down")
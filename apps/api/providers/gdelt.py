@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 import httpx
 
 from apps.api.providers.base import NewsProvider
-from packages.shared.schemas import ArticleCreate
+from packages.shared.schemas import ArticleCreate, parse_articles
 
 logger = logging.getLogger(__name__)
 
@@ -165,7 +165,7 @@ class GDELTProvider(NewsProvider):
                         pub_at = datetime.now(timezone.utc)
 
                 articles.append(
-                    ArticleCreate(
+                    dict(
                         provider=self.name,
                         source=item.get("domain", "Unknown"),
                         title=item["title"],
@@ -179,7 +179,7 @@ class GDELTProvider(NewsProvider):
                     )
                 )
             logger.info(f"GDELT: fetched {len(articles)} articles for {country}/{category}")
-            return articles
+            return parse_articles(articles)
 
         except httpx.HTTPStatusError as e:
             logger.error(f"GDELT HTTP error: {e.response.status_code}")
@@ -222,7 +222,7 @@ class GDELTProvider(NewsProvider):
                         pass
 
                 articles.append(
-                    ArticleCreate(
+                    dict(
                         provider=self.name,
                         source=item.get("domain", "Unknown"),
                         title=item["title"],
@@ -232,7 +232,7 @@ class GDELTProvider(NewsProvider):
                         image_url=item.get("socialimage"),
                     )
                 )
-            return articles
+            return parse_articles(articles)
 
         except Exception as e:
             logger.error(f"GDELT search error: {e}")
@@ -10,7 +10,7 @@ import httpx
 from apps.api.config import get_settings
 from apps.api.providers.base import NewsProvider
 from packages.shared.constants import GUARDIAN_SECTION_MAP
-from packages.shared.schemas import ArticleCreate
+from packages.shared.schemas import ArticleCreate, parse_articles
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +22,11 @@ class GuardianProvider(NewsProvider):
 
     def __init__(self):
         self.settings = get_settings()
+        # Settings are fixed for the process, so check the key once
+        self._configured = bool(self.settings.guardian_key)
 
     def is_configured(self) -> bool:
-        return bool(self.settings.guardian_key)
+        return self._configured
 
     async def fetch_top_headlines(
         self,
@@ -66,7 +68,7 @@ class GuardianProvider(NewsProvider):
 
                 fields = item.get("fields", {})
                 articles.append(
-                    ArticleCreate(
+                    dict(
                         provider=self.name,
                         source="The Guardian",
                         title=item["webTitle"],
@@ -79,7 +81,7 @@ class GuardianProvider(NewsProvider):
                     )
                 )
             logger.info(f"Guardian: fetched {len(articles)} articles for {section}")
-            return articles
+            return parse_articles(articles)
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Guardian HTTP error: {e.response.status_code}")
@@ -125,7 +127,7 @@ class GuardianProvider(NewsProvider):
 
                 fields = item.get("fields", {})
                 articles.append(
-                    ArticleCreate(
+                    dict(
                         provider=self.name,
                         source="The Guardian",
                         title=item["webTitle"],
@@ -135,7 +137,7 @@ class GuardianProvider(NewsProvider):
                         image_url=fields.get("thumbnail"),
                     )
                 )
-            return articles
+            return parse_articles(articles)
 
         except Exception as e:
             logger.error(f"Guardian search error: {e}")
@@ -10,7 +10,7 @@ import httpx
 
 from apps.api.config import get_settings
 from apps.api.providers.base import NewsProvider
-from packages.shared.schemas import ArticleCreate
+from packages.shared.schemas import ArticleCreate, parse_articles
 
 logger = logging.getLogger(__name__)
 
@@ -60,9 +60,11 @@ class NewsAPIProvider(NewsProvider):
 
     def __init__(self):
         self.settings = get_settings()
+        # Settings are fixed for the process, so check the key once
+        self._configured = bool(self.settings.newsapi_key)
 
     def is_configured(self) -> bool:
-        return bool(self.settings.newsapi_key)
+        return self._configured
 
     async def fetch_top_headlines(
         self,
@@ -156,7 +158,7 @@ class NewsAPIProvider(NewsProvider):
                     pub_at = datetime.now(timezone.utc)
 
             articles.append(
-                ArticleCreate(
+                dict(
                     provider=self.name,
                     source=item.get("source", {}).get("name", "Unknown"),
                     title=item["title"],
@@ -168,7 +170,7 @@ class NewsAPIProvider(NewsProvider):
                     image_url=item.get("urlToImage"),
                 )
             )
-        return articles
+        return parse_articles(articles)
 
     async def fetch_search(
         self,
@@ -205,7 +207,7 @@ class NewsAPIProvider(NewsProvider):
                         pass
 
                 articles.append(
-                    ArticleCreate(
+                    dict(
                         provider=self.name,
                         source=item.get("source", {}).get("name", "Unknown"),
                         title=item["title"],
@@ -215,7 +217,7 @@ class NewsAPIProvider(NewsProvider):
                         image_url=item.get("urlToImage"),
                     )
                 )
-            return articles
+            return parse_articles(articles)
 
         except Exception as e:
             logger.error(f"NewsAPI search error: {e}")
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import ClassVar
 
 from apps.api.providers.base import NewsProvider
 from apps.api.providers.gdelt import GDELTProvider
 from apps.api.providers.guardian import GuardianProvider
 from apps.api.providers.newsapi import NewsAPIProvider
-from apps.api.redis_client import CircuitBreaker
+from apps.api.redis_client import CircuitBreaker, prime_breakers
 from packages.shared.schemas import ArticleCreate
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,10 @@ class ProviderRouter:
     Priority for trending/global: GDELT → Guardian → NewsAPI
     """
 
+    # Priority chains
+    headlines_chain: ClassVar[tuple[str, ...]] = ("newsapi", "guardian", "gdelt")
+    trending_chain: ClassVar[tuple[str, ...]] = ("gdelt", "guardian", "newsapi")
+
     def __init__(self):
         self.providers: dict[str, NewsProvider] = {
             "newsapi": NewsAPIProvider(),
@@ -31,9 +36,6 @@ class ProviderRouter:
         self.breakers: dict[str, CircuitBreaker] = {
             name: CircuitBreaker(name) for name in self.providers
         }
-        # Priority chains
-        self.headlines_chain = ["newsapi", "guardian", "gdelt"]
-        self.trending_chain = ["gdelt", "guardian", "newsapi"]
 
     async def fetch_headlines(
         self,
@@ -74,6 +76,7 @@ class ProviderRouter:
         """Fetch from ALL available providers for maximum coverage (used by worker)."""
         all_articles: list[ArticleCreate] = []
         providers_used: list[str] = []
+        await prime_breakers(list(self.breakers.values()))
 
         for name in self.providers:
             provider = self.providers[name]
@@ -100,13 +103,14 @@ class ProviderRouter:
 
     async def _fetch_with_chain(
         self,
-        chain: list[str],
+        chain: tuple[str, ...],
         method: str,
         **kwargs,
     ) -> tuple[list[ArticleCreate], list[str]]:
         """Try providers in chain order. Use first successful result, but try to aggregate."""
         all_articles: list[ArticleCreate] = []
         providers_used: list[str] = []
+        await prime_breakers([self.breakers[name] for name in chain])
 
         for name in chain:
             provider = self.providers[name]
@@ -139,6 +143,7 @@ class ProviderRouter:
 
     async def get_all_statuses(self) -> list[dict]:
         statuses = []
+        await prime_breakers(list(self.breakers.values()))
         for name, breaker in self.breakers.items():
             status = await breaker.get_status()
             status["configured"] = self.providers[name].is_configured()
@@ -146,12 +151,6 @@ class ProviderRouter:
         return statuses
 
 
-# Singleton
-_router: Optional[ProviderRouter] = None
-
-
+@lru_cache(maxsize=1)
 def get_provider_router() -> ProviderRouter:
-    global _router
-    if _router is None:
-        _router = ProviderRouter()
-    return _router
+    return ProviderRouter()
@@ -6,12 +6,13 @@ works without Redis, just without caching/streams.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Final, Optional
 
+import orjson
 import redis.asyncio as aioredis
 
 from apps.api.config import get_settings
@@ -26,6 +27,13 @@ logger = logging.getLogger("aion.redis")
 _redis: Optional[aioredis.Redis] = None
 _redis_available: bool = True
 
+# Cache payloads: orjson handles datetimes and NumPy scalars/arrays natively
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(data) -> bytes:
+    return orjson.dumps(data, default=str, option=_ORJSON_OPTS)
+
 
 async def get_redis() -> Optional[aioredis.Redis]:
     global _redis, _redis_available
@@ -65,7 +73,7 @@ async def cache_get(key: str) -> Optional[dict]:
             return None
         raw = await r.get(f"cache:{key}")
         if raw:
-            return json.loads(raw)
+            return orjson.loads(raw)
     except Exception:
         pass
     return None
@@ -76,11 +84,76 @@ async def cache_set(key: str, data: dict, ttl: int = CACHE_TTL_FEED):
         r = await get_redis()
         if r is None:
             return
-        await r.set(f"cache:{key}", json.dumps(data, default=str), ex=ttl)
+        await r.set(f"cache:{key}", _dumps(data), ex=ttl)
+    except Exception:
+        pass
+
+
+async def cache_get_many(keys: list[str]) -> list[Optional[dict]]:
+    """Fetch several cache entries in one MGET round-trip."""
+    if not keys:
+        return []
+    try:
+        r = await get_redis()
+        if r is not None:
+            raws = await r.mget([f"cache:{k}" for k in keys])
+            return [orjson.loads(raw) if raw else None for raw in raws]
+    except Exception:
+        pass
+    return [None] * len(keys)
+
+
+async def cache_set_many(items: dict[str, dict], ttl: int = CACHE_TTL_FEED):
+    """Write several cache entries in one pipelined round-trip."""
+    if not items:
+        return
+    try:
+        r = await get_redis()
+        if r is None:
+            return
+        pipe = r.pipeline(transaction=False)
+        for key, data in items.items():
+            pipe.set(f"cache:{key}", _dumps(data), ex=ttl)
+        await pipe.execute()
     except Exception:
         pass
 
 
+async def cache_get_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[dict]],
+    ttl: int = CACHE_TTL_FEED,
+    lock_ttl: int = 5,
+) -> dict:
+    """Return the cached value for key, computing it at most once per expiry.
+
+    On a miss only the caller holding the refresh lock runs compute(); the
+    rest poll the cache until the value lands, falling back to computing it
+    themselves if the lock expires first (e.g. the holder crashed).
+    """
+    cached = await cache_get(key)
+    if cached:
+        return cached
+
+    if await acquire_refresh_lock(key, ttl=lock_ttl):
+        try:
+            data = await compute()
+            await cache_set(key, data, ttl)
+            return data
+        finally:
+            await release_refresh_lock(key)
+
+    deadline = time.monotonic() + lock_ttl
+    delay = 0.02
+    while time.monotonic() < deadline:
+        await asyncio.sleep(delay)
+        cached = await cache_get(key)
+        if cached:
+            return cached
+        delay = min(delay * 2, 0.25)
+    return await compute()
+
+
 async def cache_get_with_stale(key: str, stale_ttl: int = 600) -> tuple[Optional[dict], bool]:
     """Get cached data, returning stale data if fresh cache expired."""
     try:
@@ -89,10 +162,10 @@ async def cache_get_with_stale(key: str, stale_ttl: int = 600) -> tuple[Optional
             return None, False
         raw = await r.get(f"cache:{key}")
         if raw:
-            return json.loads(raw), False
+            return orjson.loads(raw), False
         raw_stale = await r.get(f"stale:{key}")
         if raw_stale:
-            return json.loads(raw_stale), True
+            return orjson.loads(raw_stale), True
     except Exception:
         pass
     return None, False
@@ -103,7 +176,7 @@ async def cache_set_with_stale(key: str, data: dict, ttl: int = CACHE_TTL_FEED,
         r = await get_redis()
         if r is None:
             return
-        serialized = json.dumps(data, default=str)
+        serialized = _dumps(data)
         pipe = r.pipeline()
         pipe.set(f"cache:{key}", serialized, ex=ttl)
         pipe.set(f"stale:{key}", serialized, ex=ttl + stale_ttl)
@@ -113,31 +186,56 @@ async def cache_set_with_stale(key: str, data: dict, ttl: int = CACHE_TTL_FEED,
 
 
 # ── Circuit Breaker ──────────────────────────────────────────────
+# Breaker state read from Redis is reused in-process for this long, so the
+# per-call "is the circuit open?" check is usually a dict lookup
+BREAKER_CACHE_TTL_NS: Final[int] = 200_000_000
+
+
+def _closed_state() -> dict:
+    return {"failures": 0, "state": "closed", "opened_at": None, "last_error": None}
+
+
 class CircuitBreaker:
-    """Per-provider circuit breaker using Redis state."""
+    """Per-provider circuit breaker using Redis state.
+
+    Redis stays authoritative (it is shared by the API and the worker);
+    each instance keeps a short-lived local copy of the last state it read
+    or wrote.
+    """
 
     def __init__(self, provider_name: str):
         self.provider = provider_name
         self.key = f"cb:{provider_name}"
+        self._cached: Optional[dict] = None
+        self._refreshed_ns = 0
+
+    def _remember(self, state: dict):
+        self._cached = state
+        self._refreshed_ns = time.monotonic_ns()
 
     async def _state(self) -> dict:
+        if self._cached is not None and time.monotonic_ns() - self._refreshed_ns < BREAKER_CACHE_TTL_NS:
+            return dict(self._cached)
+        state = _closed_state()
         try:
             r = await get_redis()
             if r is None:
-                return {"failures": 0, "state": "closed", "opened_at": None, "last_error": None}
+                return state
             raw = await r.get(self.key)
             if raw:
-                return json.loads(raw)
+                state = orjson.loads(raw)
         except Exception:
-            pass
-        return {"failures": 0, "state": "closed", "opened_at": None, "last_error": None}
+            return state
+        self._remember(state)
+        return dict(state)
 
     async def _save(self, state: dict):
+        self._remember(dict(state))
         try:
             r = await get_redis()
             if r is None:
                 return
-            await r.set(self.key, json.dumps(state, default=str), ex=CIRCUIT_BREAKER_COOLDOWN * 10)
+            await r.set(self.key, _dumps(state), ex=CIRCUIT_BREAKER_COOLDOWN * 10)
         except Exception:
             pass
 
@@ -182,6 +280,26 @@ class CircuitBreaker:
         }
 
 
+async def prime_breakers(breakers: list[CircuitBreaker]):
+    """Refresh the local state of every stale breaker with one MGET."""
+    now = time.monotonic_ns()
+    stale = [
+        b for b in breakers
+        if b._cached is None or now - b._refreshed_ns >= BREAKER_CACHE_TTL_NS
+    ]
+    if not stale:
+        return
+    try:
+        r = await get_redis()
+        if r is None:
+            return
+        raws = await r.mget([b.key for b in stale])
+    except Exception:
+        return
+    for breaker, raw in zip(stale, raws):
+        breaker._remember(orjson.loads(raw) if raw else _closed_state())
+
+
 # ── Streams (replaces Pub/Sub for SSE) ───────────────────────────
 async def stream_add(channel: str, data: dict, maxlen: int = 1000) -> str:
     """Append an event to a Redis Stream."""
@@ -190,7 +308,7 @@ async def stream_add(channel: str, data: dict, maxlen: int = 1000) -> str:
         if r is None:
             return "0-0"
         stream_key = f"stream:{channel}"
-        payload = json.dumps(data, default=str)
+        payload = _dumps(data)
         entry_id = await r.xadd(
             stream_key,
             {"payload": payload},
@@ -244,6 +362,44 @@ async def publish_event(channel: str, event_type: str, data: dict):
     await stream_add(channel, payload)
 
 
+async def publish_events(events: list[tuple[str, str, dict]], maxlen: int = 1000) -> None:
+    """Publish several (channel, event_type, data) events in one pipelined round trip."""
+    if not events:
+        return
+    try:
+        r = await get_redis()
+        if r is None:
+            return
+        async with r.pipeline(transaction=False) as pipe:
+            for channel, event_type, data in events:
+                payload = {"event": event_type, "channel": channel, "data": data}
+                pipe.xadd(
+                    f"stream:{channel}",
+                    {"payload": _dumps(payload)},
+                    maxlen=maxlen,
+                    approximate=True,
+                )
+            await pipe.execute()
+    except Exception:
+        pass
+
+
+# ── Shared counters ──────────────────────────────────────────────
+async def advance_cursor(key: str, step: int) -> Optional[int]:
+    """Atomically advance a shared cursor; returns its value before the step.
+
+    Returns None when Redis is unavailable so callers can fall back to a
+    process-local counter. A missing key starts at 0.
+    """
+    try:
+        r = await get_redis()
+        if r is None:
+            return None
+        return await r.incrby(f"cursor:{key}", step) - step
+    except Exception:
+        return None
+
+
 # ── Single-flight refresh ────────────────────────────────────────
 async def acquire_refresh_lock(key: str, ttl: int = 30) -> bool:
     try:
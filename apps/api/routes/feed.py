@@ -1,6 +1,6 @@
 """Feed endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.database import get_db
@@ -11,7 +11,7 @@ from packages.shared.schemas import FeedResponse
 router = APIRouter(prefix="/api", tags=["feed"])
 
 
-@router.get("/feed")
+@router.get("/feed", response_model=FeedResponse)
 async def feed(
     country: str = Query("", max_length=5),
     category: str = Query("general", max_length=50),
@@ -19,14 +19,14 @@ async def feed(
     cursor: int = Query(0, ge=0),
     limit: int = Query(30, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
-) -> FeedResponse:
+) -> Response:
     cat = category.lower()
     if cat not in CATEGORIES:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid category '{category}'. Must be one of: {', '.join(CATEGORIES)}",
         )
-    return await get_feed(
+    resp = await get_feed(
         db=db,
         country=country.upper().strip() if country.strip() else "",
         category=cat,
@@ -34,3 +34,6 @@ async def feed(
         cursor=cursor,
         limit=limit,
     )
+    # Already a validated FeedResponse: serialize once in pydantic-core
+    # instead of letting FastAPI re-validate it through the response model
+    return Response(content=resp.model_dump_json(), media_type="application/json")
@@ -2,9 +2,9 @@
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from apps.api.providers.router import get_provider_router
+from apps.api.providers.router import ProviderRouter, get_provider_router
 from apps.api.redis_client import get_redis
 
 router = APIRouter(tags=["health"])
@@ -28,10 +28,9 @@ async def health():
 
 
 @router.get("/health/providers")
-async def provider_health():
+async def provider_health(providers: ProviderRouter = Depends(get_provider_router)):
     """Provider health status with circuit breaker states."""
-    router = get_provider_router()
-    statuses = await router.get_all_statuses()
+    statuses = await providers.get_all_statuses()
     return {
         "providers": statuses,
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 
 from apps.api.services import visa as visa_service
 
@@ -11,16 +11,24 @@ router = APIRouter(prefix="/api/visa", tags=["visa"])
 
 @router.get("/fx-rates")
 async def fx_rates(source: str = Query("USD", min_length=3, max_length=3)):
-    return await visa_service.get_fx_rates(source.upper())
+    source = source.upper()
+    if not visa_service.is_configured():
+        return Response(visa_service.demo_fx_rates_json(source), media_type="application/json")
+    return await visa_service.get_fx_rates(source)
 
 
 @router.get("/spend-insights")
 async def spend_insights(country: str = Query("US", min_length=2, max_length=2)):
-    return await visa_service.get_spend_insights(country.upper())
+    country = country.upper()
+    if not visa_service.is_configured():
+        return Response(visa_service.demo_spend_insights_json(country), media_type="application/json")
+    return await visa_service.get_spend_insights(country)
 
 
 @router.get("/payment-volume")
 async def payment_volume():
+    if not visa_service.is_configured():
+        return Response(visa_service.demo_payment_volume_json(), media_type="application/json")
     return await visa_service.get_payment_volume()
 
 
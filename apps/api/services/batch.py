@@ -0,0 +1,54 @@
+"""Batched lookups shared across services.
+
+Each helper resolves a whole set of ids in one query and memoizes the rows
+on the session (``db.info``), so handlers running in the same request
+(one session per request via get_db) never fetch the same cluster twice.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from apps.api.database import Article, Cluster
+
+
+def _memo(db: AsyncSession, name: str) -> dict:
+    return db.info.setdefault(name, {})
+
+
+async def batch_fetch_clusters(db: AsyncSession, ids: Iterable[int]) -> dict[int, Cluster]:
+    """Return {cluster_id: Cluster} for the given ids (missing ids are omitted)."""
+    memo = _memo(db, "batch_clusters")
+    wanted = {i for i in ids if i}
+    missing = wanted - memo.keys()
+    if missing:
+        result = await db.execute(
+            select(Cluster)
+            .options(lazyload(Cluster.articles))
+            .where(Cluster.cluster_id.in_(missing))
+        )
+        found = {c.cluster_id: c for c in result.scalars().all()}
+        for cid in missing:
+            memo[cid] = found.get(cid)
+    return {cid: memo[cid] for cid in wanted if memo[cid] is not None}
+
+
+async def batch_cluster_sizes(db: AsyncSession, ids: Iterable[int]) -> dict[int, int]:
+    """Return {cluster_id: article count} for the given ids in one grouped query."""
+    memo = _memo(db, "batch_cluster_sizes")
+    wanted = {i for i in ids if i}
+    missing = wanted - memo.keys()
+    if missing:
+        result = await db.execute(
+            select(Article.cluster_id, func.count(Article.id))
+            .where(Article.cluster_id.in_(missing))
+            .group_by(Article.cluster_id)
+        )
+        counts = dict(result.all())
+        for cid in missing:
+            memo[cid] = counts.get(cid, 0)
+    return {cid: memo[cid] for cid in wanted}
@@ -1,25 +1,30 @@
 """Article deduplication and clustering service.
 
-Uses embedding-based cosine similarity (primary) with SequenceMatcher fallback.
+Uses embedding-based cosine similarity (primary) with a rapidfuzz title-ratio fallback.
 """
 
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from difflib import SequenceMatcher
 
-from sqlalchemy import select, func
+import numpy as np
+from rapidfuzz import fuzz, process
+from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from apps.api.database import Article, Cluster, ClusterMember
-from apps.api.redis_client import cache_get, cache_set, get_redis
+from apps.api.redis_client import cache_get_many, cache_set_many
 from apps.api.services.embeddings import (
     generate_embeddings,
-    cosine_similarity,
     compute_centroid,
+    decode_vector,
+    encode_vector,
 )
 from packages.shared.constants import (
+    CENTROID_SAMPLE_SIZE,
     DEDUP_SIMILARITY_THRESHOLD,
     DEDUP_TIME_WINDOW_HOURS,
     EMBEDDING_SIMILARITY_THRESHOLD,
@@ -31,38 +36,116 @@ logger = logging.getLogger(__name__)
 
 def title_similarity(a: str, b: str) -> float:
     """Compute similarity between two normalized titles (fallback method)."""
-    na = normalize_title(a)
-    nb = normalize_title(b)
-    return SequenceMatcher(None, na, nb).ratio()
+    return fuzz.ratio(normalize_title(a), normalize_title(b)) / 100.0
 
 
-async def _get_cluster_centroid(
-    db: AsyncSession, cluster_id: int
-) -> list[float] | None:
-    """Get or compute the centroid embedding for a cluster.
+def _unit(v) -> np.ndarray:
+    """Return v as a float32 unit vector, so cosine similarity is a bare dot."""
+    v = np.asarray(v, dtype=np.float32)
+    return v / max(float(np.linalg.norm(v)), 1e-12)
 
-    Checks Redis cache first, then computes from member articles.
+
+def _unit_embeddings(articles: list[Article], has_emb: np.ndarray) -> np.ndarray:
+    """Stack article embeddings into an L2-normalized (N, D) float32 matrix.
+
+    Rows for articles without an embedding are zero, so they score 0 against
+    everything.
     """
-    cache_key = f"centroid:{cluster_id}"
-    cached = await cache_get(cache_key)
-    if cached and isinstance(cached, list):
-        return cached
+    dim = next((len(a.embedding) for a in articles if a.embedding), 0)
+    emb = np.zeros((len(articles), dim), dtype=np.float32)
+    for i, a in enumerate(articles):
+        if has_emb[i] and len(a.embedding) == dim:
+            emb[i] = a.embedding
+    emb /= np.maximum(np.linalg.norm(emb, axis=1, keepdims=True), 1e-12)
+    return emb
 
-    # Compute from member articles that have embeddings
-    result = await db.execute(
-        select(Article.embedding)
-        .where(Article.cluster_id == cluster_id)
+
+def _fold_into_centroid(centroid: np.ndarray | None, n: int, v: np.ndarray) -> np.ndarray:
+    """Running-mean update of a unit centroid averaging n members with unit vector v.
+
+    Treats centroid * n as the member sum, which is exact for n <= 1 and a
+    close approximation for the tightly grouped members of a real cluster.
+    """
+    if centroid is None or n <= 0 or centroid.shape != v.shape:
+        return v
+    return _unit(centroid * n + v)
+
+
+def _pairwise_similarity(emb: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every pair of unit rows in one matmul.
+
+    The diagonal is set to -1 so an article never matches itself.
+    """
+    sims = emb @ emb.T
+    np.fill_diagonal(sims, -1.0)
+    return sims
+
+
+async def _get_cluster_centroids(
+    db: AsyncSession, cluster_ids: list[int]
+) -> dict[int, np.ndarray | None]:
+    """Get or compute unit-normalized centroid embeddings for a set of clusters.
+
+    Checks Redis cache first with one MGET (int8-quantized, see
+    encode_vector), then computes every cache miss from member articles in
+    a single windowed query (up to CENTROID_SAMPLE_SIZE each).
+    """
+    centroids: dict[int, np.ndarray | None] = {}
+    missing: list[int] = []
+    cached_rows = await cache_get_many([f"centroid:{cid}" for cid in cluster_ids])
+    for cluster_id, cached in zip(cluster_ids, cached_rows):
+        if cached and isinstance(cached, dict):
+            centroids[cluster_id] = _unit(decode_vector(cached))
+        else:
+            centroids[cluster_id] = None
+            missing.append(cluster_id)
+
+    if not missing:
+        return centroids
+
+    ranked = (
+        select(
+            Article.cluster_id,
+            Article.embedding,
+            func.row_number()
+            .over(partition_by=Article.cluster_id, order_by=Article.published_at.desc())
+            .label("rn"),
+        )
+        .where(Article.cluster_id.in_(missing))
         .where(Article.embedding.isnot(None))
-        .limit(20)
+        .subquery()
     )
-    embeddings = [row[0] for row in result.all() if row[0]]
-    if not embeddings:
-        return None
-
-    centroid = compute_centroid(embeddings)
+    result = await db.execute(
+        select(ranked.c.cluster_id, ranked.c.embedding)
+        .where(ranked.c.rn <= CENTROID_SAMPLE_SIZE)
+    )
+    members: dict[int, list[list[float]]] = {}
+    for cluster_id, embedding in result.all():
+        if embedding:
+            members.setdefault(cluster_id, []).append(embedding)
+
+    fresh: dict[str, dict] = {}
+    for cluster_id, embeddings in members.items():
+        centroid = _unit(compute_centroid(embeddings))
+        centroids[cluster_id] = centroid
+        fresh[f"centroid:{cluster_id}"] = encode_vector(centroid)
     # Cache for 5 minutes
-    await cache_set(cache_key, centroid, ttl=300)
-    return centroid
+    await cache_set_many(fresh, ttl=300)
+
+    return centroids
+
+
+async def _get_cluster_sizes(db: AsyncSession, cluster_ids: list[int]) -> dict[int, int]:
+    """Count embedded member articles per cluster in one grouped query."""
+    if not cluster_ids:
+        return {}
+    result = await db.execute(
+        select(Article.cluster_id, func.count())
+        .where(Article.cluster_id.in_(cluster_ids))
+        .where(Article.embedding.isnot(None))
+        .group_by(Article.cluster_id)
+    )
+    return dict(result.all())
 
 
 async def deduplicate_and_store(
@@ -71,21 +154,27 @@ async def deduplicate_and_store(
 ) -> list[Article]:
     """Store articles, dedup by hash, and return stored records."""
     stored = []
+    if not articles:
+        return stored
+
+    # Check every hash in one round-trip, reading only the hash column
+    result = await db.execute(
+        select(Article.hash).where(Article.hash.in_({art.hash for art in articles}))
+    )
+    seen = set(result.scalars().all())
 
+    now = datetime.now(timezone.utc)
     for art in articles:
-        # Check for existing by hash
-        existing = await db.execute(
-            select(Article).where(Article.hash == art.hash).limit(1)
-        )
-        if existing.scalar_one_or_none():
+        if art.hash in seen:
             continue
+        seen.add(art.hash)
 
         record = Article(
             provider=art.provider,
             source=art.source,
             title=art.title,
             url=art.url,
-            published_at=art.published_at or datetime.now(timezone.utc),
+            published_at=art.published_at or now,
             country=art.country,
             language=art.language,
             category=art.category,
@@ -111,13 +200,13 @@ async def _generate_missing_embeddings(db: AsyncSession) -> int:
     cutoff = datetime.now(timezone.utc) - timedelta(hours=DEDUP_TIME_WINDOW_HOURS)
 
     result = await db.execute(
-        select(Article)
+        select(Article.id, Article.title, Article.raw_snippet)
         .where(Article.embedding.is_(None))
         .where(Article.published_at >= cutoff)
         .order_by(Article.published_at.desc())
         .limit(200)
     )
-    articles = list(result.scalars().all())
+    articles = result.all()
 
     if not articles:
         return 0
@@ -129,8 +218,10 @@ async def _generate_missing_embeddings(db: AsyncSession) -> int:
     try:
         embeddings = await generate_embeddings(texts)
         if len(embeddings) == len(articles):
-            for art, emb in zip(articles, embeddings):
-                art.embedding = emb
+            await db.execute(
+                update(Article),
+                [{"id": a.id, "embedding": emb} for a, emb in zip(articles, embeddings)],
+            )
             await db.commit()
             logger.info(f"Generated embeddings for {len(articles)} articles")
             return len(articles)
@@ -148,12 +239,15 @@ async def cluster_articles(db: AsyncSession) -> int:
     """Assign unclustered articles to clusters.
 
     Primary: embedding cosine similarity (threshold 0.82)
-    Fallback: SequenceMatcher title similarity (threshold 0.75)
+    Fallback: rapidfuzz title ratio (threshold 0.75)
     """
     # Step 1: Generate embeddings for articles that don't have them
     await _generate_missing_embeddings(db)
 
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=DEDUP_TIME_WINDOW_HOURS)
+    # One timestamp for the whole batch: the window cutoff and every
+    # matched cluster's last_updated
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(hours=DEDUP_TIME_WINDOW_HOURS)
 
     # Get unclustered articles from the last window
     result = await db.execute(
@@ -168,56 +262,104 @@ async def cluster_articles(db: AsyncSession) -> int:
     if not unclustered:
         return 0
 
-    # Get recent clusters for matching
+    # Get recent clusters for matching (centroids come from the cache, so
+    # skip eager-loading every member article and its embedding)
     cluster_result = await db.execute(
         select(Cluster)
+        .options(lazyload(Cluster.articles))
         .where(Cluster.last_updated >= cutoff)
         .order_by(Cluster.last_updated.desc())
         .limit(100)
     )
     existing_clusters = list(cluster_result.scalars().all())
 
-    # Pre-compute cluster centroids for embedding comparison
-    cluster_centroids: dict[int, list[float] | None] = {}
-    for cluster in existing_clusters:
-        cluster_centroids[cluster.cluster_id] = await _get_cluster_centroid(
-            db, cluster.cluster_id
-        )
+    # Index clusters (and their normalized titles) by category once, so the
+    # per-article loops only ever see same-category candidates
+    clusters_by_cat: dict[str, list[Cluster]] = defaultdict(list)
+    titles_by_cat: dict[str, list[str]] = defaultdict(list)
+    for c in existing_clusters:
+        clusters_by_cat[c.top_category].append(c)
+        titles_by_cat[c.top_category].append(normalize_title(c.canonical_title))
+
+    # Pre-compute cluster centroids for embedding comparison, plus how many
+    # members each one averages so matches can update them in place
+    cluster_ids = [c.cluster_id for c in existing_clusters]
+    cluster_centroids = await _get_cluster_centroids(db, cluster_ids)
+    cluster_sizes = await _get_cluster_sizes(db, cluster_ids)
+
+    # Batch-level peer matching state: pairwise similarities are computed once
+    article_titles = [normalize_title(a.title) for a in unclustered]
+    categories = np.array([a.category for a in unclustered], dtype=object)
+    has_emb = np.array([bool(a.embedding) for a in unclustered], dtype=bool)
+    unit_emb = _unit_embeddings(unclustered, has_emb)
+    peer_sims = _pairwise_similarity(unit_emb)
+    assigned = np.zeros(len(unclustered), dtype=bool)
+    updated_centroids: set[int] = set()
+
+    # Same-category centroids stacked into (k, D) matrices, so matching an
+    # article against every cluster in its category is a single matvec
+    dim = unit_emb.shape[1]
+    centroid_clusters: dict[str, list[Cluster]] = defaultdict(list)
+    centroid_mats: dict[str, np.ndarray] = {}
+    centroid_row: dict[int, tuple[str, int]] = {}
+    clusters_by_id = {c.cluster_id: c for c in existing_clusters}
+
+    def set_centroid_row(cluster: Cluster) -> None:
+        """Mirror cluster_centroids[cluster] into its category matrix."""
+        centroid = cluster_centroids.get(cluster.cluster_id)
+        if centroid is None or centroid.shape != (dim,):
+            return
+        cat = cluster.top_category
+        if cluster.cluster_id in centroid_row:
+            centroid_mats[cat][centroid_row[cluster.cluster_id][1]] = centroid
+            return
+        mat = centroid_mats.get(cat)
+        centroid_mats[cat] = centroid[None, :] if mat is None else np.vstack([mat, centroid])
+        centroid_row[cluster.cluster_id] = (cat, len(centroid_clusters[cat]))
+        centroid_clusters[cat].append(cluster)
+
+    for c in existing_clusters:
+        set_centroid_row(c)
+
+    def absorb(cluster_id: int, i: int) -> None:
+        """Fold article i into its cluster's running-mean centroid."""
+        centroid = cluster_centroids.get(cluster_id)
+        n = min(cluster_sizes.get(cluster_id, 0), CENTROID_SAMPLE_SIZE)
+        if centroid is None or centroid.shape != unit_emb[i].shape:
+            n = 0
+        cluster_centroids[cluster_id] = _fold_into_centroid(centroid, n, unit_emb[i])
+        cluster_sizes[cluster_id] = n + 1
+        updated_centroids.add(cluster_id)
+        set_centroid_row(clusters_by_id[cluster_id])
 
     clusters_created = 0
     embedding_matches = 0
     title_matches = 0
 
-    for article in unclustered:
+    for i, article in enumerate(unclustered):
         matched_cluster = None
-        has_embedding = article.embedding is not None
 
         # Try embedding-based matching first (same category only)
-        if has_embedding:
-            best_sim = 0.0
-            for cluster in existing_clusters:
-                if cluster.top_category != article.category:
-                    continue
-                centroid = cluster_centroids.get(cluster.cluster_id)
-                if centroid:
-                    sim = cosine_similarity(article.embedding, centroid)
-                    if sim >= EMBEDDING_SIMILARITY_THRESHOLD and sim > best_sim:
-                        best_sim = sim
-                        matched_cluster = cluster
+        if has_emb[i] and article.category in centroid_mats:
+            sims = centroid_mats[article.category] @ unit_emb[i]
+            best = int(sims.argmax())
+            if sims[best] >= EMBEDDING_SIMILARITY_THRESHOLD:
+                matched_cluster = centroid_clusters[article.category][best]
 
             if matched_cluster:
                 embedding_matches += 1
 
         # Fallback: title similarity (for articles without embeddings, or if embedding didn't match)
-        if not matched_cluster:
-            for cluster in existing_clusters:
-                if cluster.top_category != article.category:
-                    continue
-                sim = title_similarity(article.title, cluster.canonical_title)
-                if sim >= DEDUP_SIMILARITY_THRESHOLD:
-                    matched_cluster = cluster
-                    title_matches += 1
-                    break
+        if not matched_cluster and titles_by_cat.get(article.category):
+            match = process.extractOne(
+                article_titles[i],
+                titles_by_cat[article.category],
+                scorer=fuzz.ratio,
+                score_cutoff=DEDUP_SIMILARITY_THRESHOLD * 100,
+            )
+            if match:
+                matched_cluster = clusters_by_cat[article.category][match[2]]
+                title_matches += 1
 
         if matched_cluster:
             article.cluster_id = matched_cluster.cluster_id
@@ -227,39 +369,45 @@ async def cluster_articles(db: AsyncSession) -> int:
                 source=article.source,
             )
             db.add(member)
-            matched_cluster.last_updated = datetime.now(timezone.utc)
-            # Invalidate centroid cache so it's recomputed with new member
-            if has_embedding:
-                try:
-                    r = await get_redis()
-                    await r.delete(f"cache:centroid:{matched_cluster.cluster_id}")
-                except Exception:
-                    pass
+            matched_cluster.last_updated = now
+            if has_emb[i]:
+                absorb(matched_cluster.cluster_id, i)
         else:
-            # Check against other unclustered articles in this batch
+            # Check against already-assigned articles in this batch (same category)
+            candidates = assigned & (categories == article.category)
+            peer_idx = None
+            if has_emb[i]:
+                sims = np.where(candidates & has_emb, peer_sims[i], -1.0)
+                best = int(sims.argmax())
+                if sims[best] >= EMBEDDING_SIMILARITY_THRESHOLD:
+                    peer_idx = best
+                title_candidates = candidates & ~has_emb
+            else:
+                title_candidates = candidates
+
+            if peer_idx is None and title_candidates.any():
+                match = process.extractOne(
+                    article_titles[i],
+                    {j: article_titles[j] for j in np.flatnonzero(title_candidates)},
+                    scorer=fuzz.ratio,
+                    score_cutoff=DEDUP_SIMILARITY_THRESHOLD * 100,
+                )
+                if match:
+                    peer_idx = int(match[2])
+
             found_peer = False
-            for other in unclustered:
-                if other.id == article.id or other.cluster_id is None:
-                    continue
-
-                matched = False
-                if has_embedding and other.embedding:
-                    sim = cosine_similarity(article.embedding, other.embedding)
-                    matched = sim >= EMBEDDING_SIMILARITY_THRESHOLD
-                else:
-                    sim = title_similarity(article.title, other.title)
-                    matched = sim >= DEDUP_SIMILARITY_THRESHOLD
-
-                if matched and other.cluster_id:
-                    article.cluster_id = other.cluster_id
-                    member = ClusterMember(
-                        cluster_id=other.cluster_id,
-                        article_id=article.id,
-                        source=article.source,
-                    )
-                    db.add(member)
-                    found_peer = True
-                    break
+            if peer_idx is not None:
+                other = unclustered[peer_idx]
+                article.cluster_id = other.cluster_id
+                member = ClusterMember(
+                    cluster_id=other.cluster_id,
+                    article_id=article.id,
+                    source=article.source,
+                )
+                db.add(member)
+                if has_emb[i]:
+                    absorb(other.cluster_id, i)
+                found_peer = True
 
             if not found_peer:
                 # Create new cluster
@@ -272,6 +420,7 @@ async def cluster_articles(db: AsyncSession) -> int:
                 )
                 db.add(new_cluster)
                 await db.flush()
+                clusters_by_id[new_cluster.cluster_id] = new_cluster
 
                 article.cluster_id = new_cluster.cluster_id
                 member = ClusterMember(
@@ -280,12 +429,22 @@ async def cluster_articles(db: AsyncSession) -> int:
                     source=article.source,
                 )
                 db.add(member)
-                existing_clusters.append(new_cluster)
-                # Cache centroid for new single-article cluster
-                if has_embedding:
-                    cluster_centroids[new_cluster.cluster_id] = article.embedding
+                clusters_by_cat[new_cluster.top_category].append(new_cluster)
+                titles_by_cat[new_cluster.top_category].append(
+                    normalize_title(new_cluster.canonical_title)
+                )
+                # Seed centroid for new single-article cluster
+                if has_emb[i]:
+                    absorb(new_cluster.cluster_id, i)
                 clusters_created += 1
 
+        assigned[i] = True
+
+    # Write updated centroids back instead of invalidating them
+    await cache_set_many(
+        {f"centroid:{cid}": encode_vector(cluster_centroids[cid]) for cid in updated_centroids},
+        ttl=300,
+    )
     await db.commit()
     logger.info(
         f"Clustering done: {clusters_created} new clusters, "
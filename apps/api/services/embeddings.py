@@ -2,17 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import logging
-import math
 from typing import Optional
 
 import httpx
+import numpy as np
 
 from apps.api.config import get_settings
-from packages.shared.constants import EMBEDDING_DIMENSIONS, EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE
+from packages.shared.constants import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_DIMENSIONS,
+    EMBEDDING_MAX_CONCURRENCY,
+    EMBEDDING_MODEL,
+)
 
 logger = logging.getLogger(__name__)
 
+OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+
+# Shared HTTP/2 client — keeps the TLS connection to OpenAI alive across batches
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+
 
 async def generate_embeddings(texts: list[str]) -> list[list[float]]:
     """Generate embeddings for a batch of texts using OpenAI's embedding API.
@@ -27,56 +57,65 @@ async def generate_embeddings(texts: list[str]) -> list[list[float]]:
     if not texts:
         return []
 
-    all_embeddings: list[Optional[list[float]]] = [None] * len(texts)
+    headers = {
+        "Authorization": f"Bearer {settings.openai_key}",
+        "Content-Type": "application/json",
+    }
+    sem = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
 
-    # Process in batches
-    for i in range(0, len(texts), EMBEDDING_BATCH_SIZE):
-        batch = texts[i : i + EMBEDDING_BATCH_SIZE]
-        headers = {
-            "Authorization": f"Bearer {settings.openai_key}",
-            "Content-Type": "application/json",
-        }
+    async def _embed_batch(batch: list[str], offset: int) -> tuple[int, list[dict]]:
         body = {
             "model": EMBEDDING_MODEL,
             "input": batch,
             "dimensions": EMBEDDING_DIMENSIONS,
         }
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                "https://api.openai.com/v1/embeddings",
+        async with sem:
+            resp = await _get_client().post(
+                OPENAI_EMBEDDINGS_URL,
                 headers=headers,
                 json=body,
             )
-            resp.raise_for_status()
-            data = resp.json()["data"]
-            # Sort by index to maintain order
-            for item in sorted(data, key=lambda x: x["index"]):
-                all_embeddings[i + item["index"]] = item["embedding"]
+        resp.raise_for_status()
+        return offset, resp.json()["data"]
 
-    return [e for e in all_embeddings if e is not None]
+    # Fire all batches concurrently (bounded by the semaphore for rate limits)
+    results = await asyncio.gather(*(
+        _embed_batch(texts[i : i + EMBEDDING_BATCH_SIZE], i)
+        for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+    ))
 
+    all_embeddings: list[Optional[list[float]]] = [None] * len(texts)
+    for offset, data in results:
+        for item in data:
+            all_embeddings[offset + item["index"]] = item["embedding"]
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Compute cosine similarity between two vectors. Pure Python, no numpy."""
-    if len(a) != len(b) or not a:
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+    return [e for e in all_embeddings if e is not None]
 
 
-def compute_centroid(embeddings: list[list[float]]) -> list[float]:
+def compute_centroid(embeddings) -> np.ndarray:
     """Compute the centroid (element-wise average) of a list of embeddings."""
-    if not embeddings:
-        return []
-    dim = len(embeddings[0])
-    n = len(embeddings)
-    centroid = [0.0] * dim
-    for emb in embeddings:
-        for i, v in enumerate(emb):
-            centroid[i] += v
-    return [c / n for c in centroid]
+    if not len(embeddings):
+        return np.empty(0, dtype=np.float32)
+    return np.asarray(embeddings, dtype=np.float32).mean(axis=0)
+
+
+# ── int8 quantization (compact cache codec) ──────────────────────
+def quantize(v: np.ndarray) -> tuple[np.ndarray, float]:
+    """Symmetric per-vector int8 quantization. Returns (int8 vector, scale)."""
+    scale = max(float(np.abs(v).max()), 1e-8) / 127.0
+    return np.round(v / scale).astype(np.int8), scale
+
+
+def dequantize(q: np.ndarray, scale: float) -> np.ndarray:
+    return q.astype(np.float32) * np.float32(scale)
+
+
+def encode_vector(v) -> dict:
+    """Pack a vector as base64 int8 + scale for Redis (~4x smaller than float32)."""
+    q, scale = quantize(np.asarray(v, dtype=np.float32))
+    return {"q": base64.b64encode(q.tobytes()).decode("ascii"), "s": scale}
+
+
+def decode_vector(data: dict) -> np.ndarray:
+    q = np.frombuffer(base64.b64decode(data["q"]), dtype=np.int8)
+    return dequantize(q, data["s"])
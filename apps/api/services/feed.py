@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.database import Article, Cluster, ClusterMember
 from apps.api.redis_client import cache_get_with_stale, cache_set_with_stale
+from apps.api.services.batch import batch_cluster_sizes, batch_fetch_clusters
 from packages.shared.constants import CACHE_TTL_FEED
 from packages.shared.schemas import FeedItem, FeedResponse
 
@@ -44,9 +45,7 @@ async def get_feed(
     # Check cache first
     cached, is_stale = await cache_get_with_stale(cache_key)
     if cached and not is_stale:
-        resp = FeedResponse(**cached)
-        resp.cached = True
-        return resp
+        return FeedResponse.model_validate({**cached, "cached": True})
 
     # Build query based on mode
     if mode == "trending":
@@ -59,7 +58,7 @@ async def get_feed(
         total=len(items),
         cursor=str(cursor + limit) if len(items) >= limit else None,
         updated_at=datetime.now(timezone.utc),
-        sources_used=[],
+        sources_used=(),
         cached=False,
     )
 
@@ -78,43 +77,60 @@ async def _trending_feed(
     if country:
         conditions.append(Cluster.top_country == country.upper())
     cluster_q = (
-        select(Cluster)
+        select(
+            Cluster.cluster_id,
+            Cluster.canonical_title,
+            Cluster.score,
+            Cluster.ai_summary,
+            Cluster.why_trending,
+        )
         .where(and_(*conditions))
         .order_by(desc(Cluster.score))
         .offset(offset)
         .limit(limit)
     )
-    result = await db.execute(cluster_q)
-    clusters = list(result.scalars().all())
+    clusters = (await db.execute(cluster_q)).all()
+    if not clusters:
+        return []
+    cluster_ids = [c.cluster_id for c in clusters]
+
+    # The "best" (most recent English) article of every cluster on the page
+    # in one query, instead of one lookup per cluster
+    ranked = (
+        select(
+            Article.id,
+            Article.cluster_id,
+            Article.source,
+            Article.url,
+            Article.published_at,
+            Article.country,
+            Article.category,
+            Article.image_url,
+            func.row_number()
+            .over(partition_by=Article.cluster_id, order_by=desc(Article.published_at))
+            .label("rn"),
+        )
+        .where(
+            and_(
+                Article.cluster_id.in_(cluster_ids),
+                _is_english_language_clause(),
+            )
+        )
+        .subquery()
+    )
+    art_result = await db.execute(select(ranked).where(ranked.c.rn == 1))
+    best = {row.cluster_id: row for row in art_result.all()}
+    sizes = await batch_cluster_sizes(db, cluster_ids)
 
+    # Only the page's rows become FeedItems; model_construct skips
+    # re-validating values that are already typed
     items = []
     for cluster in clusters:
-        # Get the "best" article for this cluster (most recent with image)
-        art_q = (
-            select(Article)
-            .where(
-                and_(
-                    Article.cluster_id == cluster.cluster_id,
-                    _is_english_language_clause(),
-                )
-            )
-            .order_by(desc(Article.published_at))
-            .limit(1)
-        )
-        art_result = await db.execute(art_q)
-        article = art_result.scalar_one_or_none()
-        if not article:
+        article = best.get(cluster.cluster_id)
+        if article is None:
             continue
-
-        # Count articles in cluster
-        count_q = select(func.count(Article.id)).where(
-            Article.cluster_id == cluster.cluster_id
-        )
-        count_result = await db.execute(count_q)
-        cluster_size = count_result.scalar() or 1
-
         items.append(
-            FeedItem(
+            FeedItem.model_construct(
                 id=article.id,
                 title=cluster.canonical_title,
                 source=article.source,
@@ -124,7 +140,7 @@ async def _trending_feed(
                 category=article.category,
                 image_url=article.image_url,
                 cluster_id=cluster.cluster_id,
-                cluster_size=cluster_size,
+                cluster_size=sizes.get(cluster.cluster_id) or 1,
                 score=cluster.score,
                 ai_summary=cluster.ai_summary,
                 why_trending=cluster.why_trending,
@@ -151,6 +167,11 @@ async def _latest_feed(
     result = await db.execute(query)
     articles = list(result.scalars().all())
 
+    # Cluster rows and sizes for the whole page in two queries
+    cluster_ids = {a.cluster_id for a in articles if a.cluster_id}
+    clusters = await batch_fetch_clusters(db, cluster_ids)
+    sizes = await batch_cluster_sizes(db, cluster_ids)
+
     items = []
     for article in articles:
         cluster_size = 1
@@ -158,23 +179,14 @@ async def _latest_feed(
         score = 0.0
 
         if article.cluster_id:
-            count_q = select(func.count(Article.id)).where(
-                Article.cluster_id == article.cluster_id
-            )
-            count_result = await db.execute(count_q)
-            cluster_size = count_result.scalar() or 1
-
-            cluster_q = select(Cluster).where(
-                Cluster.cluster_id == article.cluster_id
-            )
-            cluster_result = await db.execute(cluster_q)
-            cluster = cluster_result.scalar_one_or_none()
+            cluster_size = sizes.get(article.cluster_id) or 1
+            cluster = clusters.get(article.cluster_id)
             if cluster:
                 ai_summary = cluster.ai_summary
                 score = cluster.score
 
         items.append(
-            FeedItem(
+            FeedItem.model_construct(
                 id=article.id,
                 title=article.title,
                 source=article.source,
@@ -7,7 +7,7 @@ key is missing or invalid (same pattern as visa.py).
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Optional
 
 import httpx
 
@@ -19,6 +19,27 @@ logger = logging.getLogger("aion.heygen")
 HEYGEN_BASE = "https://api.heygen.com"
 CACHE_TTL_AVATARS = 600  # 10 minutes
 
+# Shared client — reuses the TLS connection to HeyGen across requests
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+
 # ── Demo avatars (used when API key is missing/invalid) ──────
 
 DEMO_AVATARS: list[dict[str, Any]] = [
@@ -60,13 +81,13 @@ async def list_avatars() -> tuple[list[dict[str, Any]], bool]:
         return DEMO_AVATARS, True
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{HEYGEN_BASE}/v2/avatars",
-                headers=_headers(),
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().get(
+            f"{HEYGEN_BASE}/v2/avatars",
+            headers=_headers(),
+            timeout=15.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         avatars = []
         for a in data.get("data", {}).get("avatars", []):
@@ -98,28 +119,26 @@ async def upload_photo(image_bytes: bytes, filename: str) -> dict[str, Any]:
 
     try:
         # Step 1: Upload the image asset
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            upload_resp = await client.post(
-                f"{HEYGEN_BASE}/v1/asset",
-                headers={"X-Api-Key": get_settings().heygen_api_key},
-                files={"file": (filename, image_bytes, "image/jpeg")},
-            )
-            upload_resp.raise_for_status()
-            upload_data = upload_resp.json()
+        upload_resp = await _get_client().post(
+            f"{HEYGEN_BASE}/v1/asset",
+            headers={"X-Api-Key": get_settings().heygen_api_key},
+            files={"file": (filename, image_bytes, "image/jpeg")},
+        )
+        upload_resp.raise_for_status()
+        upload_data = upload_resp.json()
 
         image_key = upload_data.get("data", {}).get("id", "") or upload_data.get("data", {}).get("image_key", "")
         if not image_key:
             return {"error": "Failed to upload image — no asset ID returned"}
 
         # Step 2: Create a photo avatar group
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            create_resp = await client.post(
-                f"{HEYGEN_BASE}/v2/photo_avatar/avatar_group/create",
-                headers={**_headers(), "Content-Type": "application/json"},
-                json={"image_key": image_key},
-            )
-            create_resp.raise_for_status()
-            create_data = create_resp.json()
+        create_resp = await _get_client().post(
+            f"{HEYGEN_BASE}/v2/photo_avatar/avatar_group/create",
+            headers={**_headers(), "Content-Type": "application/json"},
+            json={"image_key": image_key},
+        )
+        create_resp.raise_for_status()
+        create_data = create_resp.json()
 
         group_id = create_data.get("data", {}).get("group_id", "")
 
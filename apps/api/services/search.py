@@ -1,6 +1,9 @@
 """Search service — multi-signal ranked search with fast suggestions.
 
-Ranking algorithm combines:
+Candidate retrieval runs in Postgres: full search uses a prefix tsquery
+ranked by ts_rank_cd, suggestions use pg_trgm similarity when installed
+(both GIN-indexed, see apps.api.database). The small candidate set is then
+re-ranked by:
   1. Text relevance (exact > prefix > word-boundary > substring)
   2. Recency decay (newer articles score higher)
   3. Cluster score (trending/popular stories boost)
@@ -9,17 +12,28 @@ Ranking algorithm combines:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 import re
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
-from sqlalchemy import select, func, or_, desc, case, literal
+import numpy as np
+
+from sqlalchemy import select, func, or_, desc, literal, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
-from apps.api.database import Article, Cluster
-from apps.api.redis_client import cache_get, cache_set
+from apps.api.database import (
+    Article,
+    Cluster,
+    get_session_factory,
+    pg_trgm_enabled,
+    simple_tsvector,
+)
+from apps.api.redis_client import cache_get_or_compute
 
 logger = logging.getLogger("aion.search")
 
@@ -28,13 +42,41 @@ SUGGEST_CACHE_TTL = 120   # 2 minutes
 SEARCH_CACHE_TTL = 180    # 3 minutes
 MAX_SUGGESTIONS = 8
 MAX_SEARCH_RESULTS = 30
+SEARCH_CANDIDATES = 100   # rows fetched (DB-ranked) before re-ranking
+MAX_PER_SOURCE = 3        # source diversity cap in full search results
+
+_LOG1P_50_INV = 1.0 / math.log1p(50)  # cluster boost saturates at score 50
 
 # ── Text relevance scoring ───────────────────────────────────────
+_WORD_RE = re.compile(r"\w+")
+# ASCII titles: map every non-word character to a space, so str.split()
+# yields exactly the tokens _WORD_RE would, without the regex engine
+_ASCII_NON_WORD = str.maketrans({
+    c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")
+})
+TITLE_DIGEST_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=TITLE_DIGEST_CACHE_SIZE)
+def _title_digest(title: str) -> tuple[str, tuple[str, ...]]:
+    """Lowercased title and its word tokens, memoized across queries.
+
+    The same article and cluster titles come back for many different
+    searches, so their normalization is done once per process.
+    """
+    t = title.lower().strip()
+    # t is already lowercased, so the tokens need no further folding
+    if t.isascii():
+        words = t.translate(_ASCII_NON_WORD).split()
+    else:
+        words = _WORD_RE.findall(t)
+    return t, tuple(words)
+
 
-def _text_relevance(title: str, query: str) -> float:
-    """Score how well a title matches the query (0-1 scale).
+def _relevance_scorer(query: str) -> Callable[[str], float]:
+    """Prepare the query once and return a per-title scorer.
 
-    Scoring tiers:
+    The scorer rates how well a title matches the query (0-1 scale):
       1.0 — exact match (title == query)
       0.9 — title starts with query
       0.8 — all query words found at word boundaries
@@ -42,63 +84,83 @@ def _text_relevance(title: str, query: str) -> float:
       0.4 — some query words match at word boundaries
       0.2 — partial substring match
       0.0 — no match
+
+    Ranking loops score every candidate against the same query, so the
+    lowercasing and word split of the query is hoisted out of the loop.
     """
-    t = title.lower().strip()
     q = query.lower().strip()
+    query_words = q.split()
+    total_words = len(query_words)
 
-    if not q:
-        return 0.0
+    def score(title: str) -> float:
+        if not q:
+            return 0.0
 
-    # Exact match
-    if t == q:
-        return 1.0
+        t, title_words = _title_digest(title)
 
-    # Starts with query
-    if t.startswith(q):
-        return 0.9
+        # Exact match
+        if t == q:
+            return 1.0
 
-    # Word-level matching
-    query_words = q.split()
-    if not query_words:
-        return 0.0
+        # Starts with query
+        if t.startswith(q):
+            return 0.9
 
-    # Check word-boundary matches (word starts with query word)
-    title_words = re.findall(r'\w+', t)
-    title_words_lower = [w.lower() for w in title_words]
+        # Word-level matching
+        if not query_words:
+            return 0.0
 
-    boundary_matches = 0
-    substring_matches = 0
-    for qw in query_words:
-        # Word boundary: any title word starts with query word
-        if any(tw.startswith(qw) for tw in title_words_lower):
-            boundary_matches += 1
-        elif qw in t:
-            substring_matches += 1
+        # Single-word query: a boundary match implies a substring match, so
+        # one `in` check rules out most titles and the tiers collapse to two
+        if total_words == 1:
+            if q not in t:
+                return 0.0
+            return 0.8 if any(tw.startswith(q) for tw in title_words) else 0.6
 
-    total_words = len(query_words)
+        # Check word-boundary matches (word starts with query word)
+        boundary_matches = 0
+        substring_matches = 0
+        for qw in query_words:
+            # Word boundary: any title word starts with query word
+            if any(tw.startswith(qw) for tw in title_words):
+                boundary_matches += 1
+            elif qw in t:
+                substring_matches += 1
 
-    if boundary_matches == total_words:
-        return 0.8
+        if boundary_matches == total_words:
+            return 0.8
 
-    if boundary_matches + substring_matches == total_words:
-        return 0.6
+        if boundary_matches + substring_matches == total_words:
+            return 0.6
 
-    if boundary_matches > 0:
-        return 0.2 + 0.2 * (boundary_matches / total_words)
+        if boundary_matches > 0:
+            return 0.2 + 0.2 * (boundary_matches / total_words)
 
-    if substring_matches > 0:
-        return 0.1 + 0.1 * (substring_matches / total_words)
+        if substring_matches > 0:
+            return 0.1 + 0.1 * (substring_matches / total_words)
 
-    return 0.0
+        return 0.0
+
+    return score
+
+
+# Exponential decay per second of age: half-life of 24 hours
+_RECENCY_DECAY = 0.029 / 3600
 
 
-def _recency_score(published_at: datetime | None, now: datetime) -> float:
-    """Score recency on 0-1 scale. Articles <1h old get 1.0, decays over 7 days."""
-    if not published_at:
+def _epoch(ts: datetime | None) -> float | None:
+    """Epoch seconds for a timestamptz value (columns are tz-aware)."""
+    return ts.timestamp() if ts else None
+
+
+def _recency_score(pub_ts: float | None, now_ts: float) -> float:
+    """Score recency on 0-1 scale. Articles <1h old get 1.0, decays over 7 days.
+
+    Both arguments are epoch seconds.
+    """
+    if not pub_ts:
         return 0.1
-    age_hours = max(0, (now - published_at.replace(tzinfo=timezone.utc if published_at.tzinfo is None else published_at.tzinfo)).total_seconds()) / 3600
-    # Exponential decay: half-life of 24 hours
-    return max(0.05, math.exp(-0.029 * age_hours))
+    return max(0.05, math.exp(-_RECENCY_DECAY * max(0.0, now_ts - pub_ts)))
 
 
 def _cluster_boost(score: float) -> float:
@@ -106,14 +168,49 @@ def _cluster_boost(score: float) -> float:
     if score <= 0:
         return 0.0
     # Log scale: score of 10 => ~0.7, score of 50 => ~1.0
-    return min(1.0, math.log1p(score) / math.log1p(50))
+    return min(1.0, math.log1p(score) * _LOG1P_50_INV)
+
+
+def _recency_scores(pub_ts: np.ndarray, now_ts: float) -> np.ndarray:
+    """Vectorized _recency_score over epoch seconds (NaN = unknown)."""
+    age = np.maximum(0.0, now_ts - pub_ts)
+    return np.where(np.isnan(pub_ts), 0.1, np.maximum(0.05, np.exp(-_RECENCY_DECAY * age)))
+
+
+def _cluster_boosts(scores: np.ndarray) -> np.ndarray:
+    """Vectorized _cluster_boost over an array of cluster scores."""
+    positive = np.maximum(scores, 0.0)
+    return np.where(scores > 0, np.minimum(1.0, np.log1p(positive) * _LOG1P_50_INV), 0.0)
 
 
 def _combined_rank(text_rel: float, recency: float, cluster_boost: float) -> float:
-    """Combine signals into final rank. Text relevance is dominant signal."""
+    """Combine signals into final rank. Text relevance is dominant signal.
+
+    Works element-wise on NumPy arrays as well as on scalars.
+    """
     return (text_rel * 0.55) + (recency * 0.25) + (cluster_boost * 0.20)
 
 
+def _prefix_tsquery(query: str):
+    """Build ``to_tsquery('simple', 'w1:* & w2:*')`` so every word matches as a prefix."""
+    words = _WORD_RE.findall(query.lower())
+    if not words:
+        return None
+    return func.to_tsquery(
+        literal_column("'simple'"), " & ".join(f"{w}:*" for w in words)
+    )
+
+
+async def _execute_concurrently(db: AsyncSession, first, second):
+    """Run two independent statements at once.
+
+    An AsyncSession can't run concurrent statements, so the second one goes
+    through its own pooled session.
+    """
+    async with get_session_factory()() as side:
+        return await asyncio.gather(db.execute(first), side.execute(second))
+
+
 # ── Suggestions ──────────────────────────────────────────────────
 
 async def get_suggestions(db: AsyncSession, query: str) -> dict[str, Any]:
@@ -125,40 +222,52 @@ async def get_suggestions(db: AsyncSession, query: str) -> dict[str, Any]:
     if len(q) < 2:
         return {"query": q, "suggestions": []}
 
-    cache_key = f"search:suggest:{q.lower()}"
-    cached = await cache_get(cache_key)
-    if cached:
-        return cached
+    return await cache_get_or_compute(
+        f"search:suggest:{q.lower()}",
+        lambda: _build_suggestions(db, q),
+        ttl=SUGGEST_CACHE_TTL,
+    )
 
-    pattern = f"%{q}%"
-    now = datetime.now(timezone.utc)
 
-    # Search articles by title (ILIKE for case-insensitive)
+async def _build_suggestions(db: AsyncSession, q: str) -> dict[str, Any]:
+    pattern = f"%{q}%"
+    now_ts = datetime.now(timezone.utc).timestamp()
+    # Without pg_trgm there is no similarity(); fall back to newest/top first
+    trgm = pg_trgm_enabled()
+
+    # Search articles by title (ILIKE, served by the pg_trgm GIN index)
+    art_order = [desc(Article.published_at)]
+    if trgm:
+        art_order.insert(0, desc(func.similarity(Article.title, q)))
     art_q = (
         select(Article.id, Article.title, Article.source, Article.category,
                Article.published_at, Article.image_url, Article.cluster_id)
         .where(Article.title.ilike(pattern))
-        .order_by(desc(Article.published_at))
-        .limit(50)
+        .order_by(*art_order)
+        .limit(30)
     )
-    art_result = await db.execute(art_q)
-    articles = art_result.all()
 
     # Search clusters by canonical title
+    cl_order = [desc(Cluster.score)]
+    if trgm:
+        cl_order.insert(0, desc(func.similarity(Cluster.canonical_title, q)))
     cl_q = (
         select(Cluster.cluster_id, Cluster.canonical_title, Cluster.top_category,
                Cluster.score, Cluster.last_updated)
         .where(Cluster.canonical_title.ilike(pattern))
-        .order_by(desc(Cluster.score))
+        .order_by(*cl_order)
         .limit(20)
     )
-    cl_result = await db.execute(cl_q)
+    art_result, cl_result = await _execute_concurrently(db, art_q, cl_q)
+    articles = art_result.all()
     clusters = cl_result.all()
 
     # Rank and merge suggestions
     suggestions: list[dict[str, Any]] = []
     seen_titles: set[str] = set()
 
+    relevance = _relevance_scorer(q)
+
     # Rank clusters first (they represent story groups)
     for cl in clusters:
         title_norm = cl.canonical_title.lower().strip()
@@ -166,8 +275,8 @@ async def get_suggestions(db: AsyncSession, query: str) -> dict[str, Any]:
             continue
         seen_titles.add(title_norm)
 
-        rel = _text_relevance(cl.canonical_title, q)
-        rec = _recency_score(cl.last_updated, now)
+        rel = relevance(cl.canonical_title)
+        rec = _recency_score(_epoch(cl.last_updated), now_ts)
         boost = _cluster_boost(cl.score)
         rank = _combined_rank(rel, rec, boost)
 
@@ -186,8 +295,8 @@ async def get_suggestions(db: AsyncSession, query: str) -> dict[str, Any]:
             continue
         seen_titles.add(title_norm)
 
-        rel = _text_relevance(art.title, q)
-        rec = _recency_score(art.published_at, now)
+        rel = relevance(art.title)
+        rec = _recency_score(_epoch(art.published_at), now_ts)
         # Articles without cluster get no cluster boost
         rank = _combined_rank(rel, rec, 0.0)
 
@@ -202,12 +311,10 @@ async def get_suggestions(db: AsyncSession, query: str) -> dict[str, Any]:
         })
 
     # Sort by combined rank descending, take top N
-    suggestions.sort(key=lambda x: x["score"], reverse=True)
-    suggestions = suggestions[:MAX_SUGGESTIONS]
+    order = np.argsort([-s["score"] for s in suggestions], kind="stable")
+    suggestions = [suggestions[k] for k in order[:MAX_SUGGESTIONS]]
 
-    result = {"query": q, "suggestions": suggestions}
-    await cache_set(cache_key, result, SUGGEST_CACHE_TTL)
-    return result
+    return {"query": q, "suggestions": suggestions}
 
 
 # ── Full search ──────────────────────────────────────────────────
@@ -228,70 +335,96 @@ async def search_articles(
     if len(q) < 2:
         return {"query": q, "results": [], "total": 0}
 
-    cache_key = f"search:full:{q.lower()}:{category}:{country}:{offset}"
-    cached = await cache_get(cache_key)
-    if cached:
-        return cached
+    return await cache_get_or_compute(
+        f"search:full:{q.lower()}:{category}:{country}:{offset}",
+        lambda: _build_search(db, q, category, country, limit, offset),
+        ttl=SEARCH_CACHE_TTL,
+    )
 
-    pattern = f"%{q}%"
-    now = datetime.now(timezone.utc)
+
+async def _build_search(
+    db: AsyncSession, q: str, category: str, country: str, limit: int, offset: int
+) -> dict[str, Any]:
+    tsquery = _prefix_tsquery(q)
+    if tsquery is None:
+        return {"query": q, "results": [], "total": 0}
+    tsv = simple_tsvector(Article.title)
+    now_ts = datetime.now(timezone.utc).timestamp()
 
     # Build conditions
-    conditions = [Article.title.ilike(pattern)]
+    conditions = [tsv.op("@@")(tsquery)]
     if category:
         conditions.append(Article.category == category)
     if country:
         conditions.append(Article.country == country.upper())
 
-    # Fetch candidates (generous limit for re-ranking)
-    art_q = (
-        select(Article)
+    # Rank matches in the DB and keep at most MAX_PER_SOURCE per source
+    # (source diversity), so only the diversified candidates are returned
+    ts_rank = func.ts_rank_cd(tsv, tsquery)
+    ranked_q = (
+        select(
+            Article.id, Article.title, Article.source, Article.url,
+            Article.published_at, Article.country, Article.category,
+            Article.image_url, Article.cluster_id,
+            ts_rank.label("ts_rank"),
+            func.row_number()
+            .over(partition_by=Article.source, order_by=(ts_rank.desc(), Article.published_at.desc()))
+            .label("rn"),
+        )
         .where(*conditions)
-        .order_by(desc(Article.published_at))
-        .limit(200)
+        .subquery()
+    )
+    candidates = (
+        select(ranked_q)
+        .where(ranked_q.c.rn <= MAX_PER_SOURCE)
+        .order_by(ranked_q.c.ts_rank.desc(), ranked_q.c.published_at.desc())
+        .limit(SEARCH_CANDIDATES)
+        .subquery()
+    )
+    art_q = select(candidates).order_by(
+        candidates.c.ts_rank.desc(), candidates.c.published_at.desc()
     )
-    art_result = await db.execute(art_q)
-    articles = list(art_result.scalars().all())
-
-    # Fetch cluster info for articles that have clusters
-    cluster_ids = {a.cluster_id for a in articles if a.cluster_id}
-    cluster_map: dict[int, Cluster] = {}
-    if cluster_ids:
-        cl_q = select(Cluster).where(Cluster.cluster_id.in_(cluster_ids))
-        cl_result = await db.execute(cl_q)
-        for cl in cl_result.scalars().all():
-            cluster_map[cl.cluster_id] = cl
-
-    # Rank all candidates
-    ranked: list[tuple[float, Article]] = []
-    for art in articles:
-        rel = _text_relevance(art.title, q)
-        if rel == 0.0:
-            continue
-        rec = _recency_score(art.published_at, now)
-        boost = 0.0
-        if art.cluster_id and art.cluster_id in cluster_map:
-            boost = _cluster_boost(cluster_map[art.cluster_id].score)
-        rank = _combined_rank(rel, rec, boost)
-        ranked.append((rank, art))
-
-    ranked.sort(key=lambda x: x[0], reverse=True)
 
-    # Source diversity: don't show >3 results from same source
-    source_counts: dict[str, int] = {}
-    diversified: list[tuple[float, Article]] = []
-    for rank_score, art in ranked:
-        sc = source_counts.get(art.source, 0)
-        if sc >= 3:
-            continue
-        source_counts[art.source] = sc + 1
-        diversified.append((rank_score, art))
+    # Cluster info for the same candidate set, fetched concurrently
+    cl_q = (
+        select(Cluster)
+        .options(lazyload(Cluster.articles))
+        .where(Cluster.cluster_id.in_(select(candidates.c.cluster_id)))
+    )
 
-    total = len(diversified)
-    page = diversified[offset:offset + limit]
+    art_result, cl_result = await _execute_concurrently(db, art_q, cl_q)
+    articles = art_result.all()
+    cluster_map: dict[int, Cluster] = {
+        cl.cluster_id: cl for cl in cl_result.scalars().all()
+    }
+
+    # Re-rank the candidates: text relevance per title, the rest vectorized
+    relevance = _relevance_scorer(q)
+    rels = np.array([relevance(art.title) for art in articles], dtype=np.float64)
+    keep = np.flatnonzero(rels > 0.0)
+    kept = [articles[i] for i in keep]
+    pub_ts = np.array(
+        [_epoch(art.published_at) or np.nan for art in kept], dtype=np.float64
+    )
+    rec = _recency_scores(pub_ts, now_ts)
+    boost = _cluster_boosts(np.array(
+        [
+            (cluster_map[art.cluster_id].score or 0.0) if art.cluster_id in cluster_map else 0.0
+            for art in kept
+        ],
+        dtype=np.float64,
+    ))
+    ranks = _combined_rank(rels[keep], rec, boost)
+
+    # Order by combined rank; stable, so ties keep the DB ranking order
+    order = np.argsort(-ranks, kind="stable")
+    total = len(order)
+    page = order[offset:offset + limit]
+    page_scores = np.round(ranks[page], 4).tolist()
 
     results = []
-    for rank_score, art in page:
+    for k, rank_score in zip(page, page_scores):
+        art = kept[k]
         cluster_info = None
         if art.cluster_id and art.cluster_id in cluster_map:
             cl = cluster_map[art.cluster_id]
@@ -307,15 +440,13 @@ async def search_articles(
             "title": art.title,
             "source": art.source,
             "url": art.url,
-            "published_at": art.published_at.isoformat() if art.published_at else None,
+            "published_at": art.published_at,
             "country": art.country,
             "category": art.category,
             "image_url": art.image_url,
             "cluster_id": art.cluster_id,
-            "relevance_score": round(rank_score, 4),
+            "relevance_score": rank_score,
             "cluster": cluster_info,
         })
 
-    result = {"query": q, "results": results, "total": total}
-    await cache_set(cache_key, result, SEARCH_CACHE_TTL)
-    return result
+    return {"query": q, "results": results, "total": total}
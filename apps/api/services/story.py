@@ -5,8 +5,9 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, lazyload
 
 from apps.api.database import Article, Cluster
 from apps.api.redis_client import cache_get, cache_set
@@ -15,6 +16,43 @@ from packages.shared.schemas import ArticleRead, ClusterRead, StoryIntelligence
 
 logger = logging.getLogger(__name__)
 
+_Member = aliased(Article)
+
+
+def _cluster_stats():
+    """Correlated per-cluster subqueries: article count and distinct sources."""
+    in_cluster = _Member.cluster_id == Cluster.cluster_id
+    article_count = (
+        select(func.count(_Member.id)).where(in_cluster)
+        .correlate(Cluster).scalar_subquery().label("article_count")
+    )
+    sources = (
+        select(func.array_agg(func.distinct(_Member.source))).where(in_cluster)
+        .correlate(Cluster).scalar_subquery().label("sources")
+    )
+    return article_count, sources
+
+
+def _cluster_read(cluster: Cluster, article_count, sources, top_image_url) -> ClusterRead:
+    # ORM rows are already typed; model_construct skips re-validating them
+    return ClusterRead.model_construct(
+        cluster_id=cluster.cluster_id,
+        canonical_title=cluster.canonical_title,
+        canonical_url=cluster.canonical_url,
+        top_country=cluster.top_country,
+        top_category=cluster.top_category,
+        tags_json=cluster.tags_json or [],
+        ai_summary=cluster.ai_summary,
+        ai_key_points_json=cluster.ai_key_points_json or [],
+        ai_entities_json=cluster.ai_entities_json or {},
+        why_trending=cluster.why_trending,
+        score=cluster.score,
+        last_updated=cluster.last_updated,
+        article_count=article_count or 0,
+        sources=list(sources or []),
+        top_image_url=top_image_url,
+    )
+
 
 async def get_story(db: AsyncSession, article_id: int) -> StoryIntelligence | None:
     """Get full story intelligence for an article."""
@@ -23,13 +61,19 @@ async def get_story(db: AsyncSession, article_id: int) -> StoryIntelligence | No
     if cached:
         return StoryIntelligence(**cached)
 
-    # Fetch article
-    result = await db.execute(select(Article).where(Article.id == article_id))
-    article = result.scalar_one_or_none()
-    if not article:
+    # Fetch article with its cluster and cluster stats in one round-trip
+    result = await db.execute(
+        select(Article, Cluster, *_cluster_stats())
+        .outerjoin(Cluster, Cluster.cluster_id == Article.cluster_id)
+        .options(lazyload(Cluster.articles))
+        .where(Article.id == article_id)
+    )
+    row = result.first()
+    if not row:
         return None
+    article, cluster, article_count, sources = row
 
-    article_read = ArticleRead(
+    article_read = ArticleRead.model_construct(
         id=article.id,
         provider=article.provider,
         source=article.source,
@@ -51,83 +95,44 @@ async def get_story(db: AsyncSession, article_id: int) -> StoryIntelligence | No
     related = []
     source_angles = []
 
-    if article.cluster_id:
-        # Fetch cluster
-        cl_result = await db.execute(
-            select(Cluster).where(Cluster.cluster_id == article.cluster_id)
+    if cluster:
+        cluster_read = _cluster_read(cluster, article_count, sources, article.image_url)
+
+        # Get related articles
+        rel_result = await db.execute(
+            select(Article)
+            .where(Article.cluster_id == article.cluster_id)
+            .where(Article.id != article.id)
+            .order_by(desc(Article.published_at))
+            .limit(10)
         )
-        cluster = cl_result.scalar_one_or_none()
-        if cluster:
-            # Count articles in cluster
-            from sqlalchemy import func
-            count_result = await db.execute(
-                select(func.count(Article.id)).where(
-                    Article.cluster_id == cluster.cluster_id
+        for rel in rel_result.scalars().all():
+            related.append(
+                ArticleRead.model_construct(
+                    id=rel.id,
+                    provider=rel.provider,
+                    source=rel.source,
+                    title=rel.title,
+                    url=rel.url,
+                    published_at=rel.published_at,
+                    country=rel.country,
+                    language=rel.language,
+                    category=rel.category,
+                    raw_snippet=rel.raw_snippet,
+                    image_url=rel.image_url,
+                    cluster_id=rel.cluster_id,
+                    hash=rel.hash,
+                    fetched_at=rel.fetched_at,
                 )
             )
-            article_count = count_result.scalar() or 0
 
-            # Get unique sources
-            sources_result = await db.execute(
-                select(Article.source)
-                .where(Article.cluster_id == cluster.cluster_id)
-                .distinct()
-            )
-            sources = [r[0] for r in sources_result.all()]
-
-            cluster_read = ClusterRead(
-                cluster_id=cluster.cluster_id,
-                canonical_title=cluster.canonical_title,
-                canonical_url=cluster.canonical_url,
-                top_country=cluster.top_country,
-                top_category=cluster.top_category,
-                tags_json=cluster.tags_json or [],
-                ai_summary=cluster.ai_summary,
-                ai_key_points_json=cluster.ai_key_points_json or [],
-                ai_entities_json=cluster.ai_entities_json or {},
-                why_trending=cluster.why_trending,
-                score=cluster.score,
-                last_updated=cluster.last_updated,
-                article_count=article_count,
-                sources=sources,
-                top_image_url=article.image_url,
-            )
-
-            # Get related articles
-            rel_result = await db.execute(
-                select(Article)
-                .where(Article.cluster_id == article.cluster_id)
-                .where(Article.id != article.id)
-                .order_by(desc(Article.published_at))
-                .limit(10)
-            )
-            for rel in rel_result.scalars().all():
-                related.append(
-                    ArticleRead(
-                        id=rel.id,
-                        provider=rel.provider,
-                        source=rel.source,
-                        title=rel.title,
-                        url=rel.url,
-                        published_at=rel.published_at,
-                        country=rel.country,
-                        language=rel.language,
-                        category=rel.category,
-                        raw_snippet=rel.raw_snippet,
-                        image_url=rel.image_url,
-                        cluster_id=rel.cluster_id,
-                        hash=rel.hash,
-                        fetched_at=rel.fetched_at,
-                    )
-                )
-
-            # Build source angles
-            for rel in related[:5]:
-                source_angles.append({
-                    "source": rel.source,
-                    "headline": rel.title,
-                    "angle": rel.raw_snippet[:120] if rel.raw_snippet else "",
-                })
+        # Build source angles
+        for rel in related[:5]:
+            source_angles.append({
+                "source": rel.source,
+                "headline": rel.title,
+                "angle": rel.raw_snippet[:120] if rel.raw_snippet else "",
+            })
 
     intelligence = StoryIntelligence(
         article=article_read,
@@ -152,49 +157,25 @@ async def get_cluster_detail(db: AsyncSession, cluster_id: int) -> ClusterRead |
     if cached:
         return ClusterRead(**cached)
 
+    top_image = (
+        select(_Member.image_url)
+        .where(_Member.cluster_id == Cluster.cluster_id)
+        .where(_Member.image_url.isnot(None))
+        .limit(1)
+        .correlate(Cluster)
+        .scalar_subquery()
+        .label("top_image")
+    )
     result = await db.execute(
-        select(Cluster).where(Cluster.cluster_id == cluster_id)
+        select(Cluster, *_cluster_stats(), top_image)
+        .options(lazyload(Cluster.articles))
+        .where(Cluster.cluster_id == cluster_id)
     )
-    cluster = result.scalar_one_or_none()
-    if not cluster:
+    row = result.first()
+    if not row:
         return None
 
-    from sqlalchemy import func
-    count_result = await db.execute(
-        select(func.count(Article.id)).where(Article.cluster_id == cluster_id)
-    )
-    article_count = count_result.scalar() or 0
-
-    sources_result = await db.execute(
-        select(Article.source).where(Article.cluster_id == cluster_id).distinct()
-    )
-    sources = [r[0] for r in sources_result.all()]
-
-    img_result = await db.execute(
-        select(Article.image_url)
-        .where(Article.cluster_id == cluster_id)
-        .where(Article.image_url.isnot(None))
-        .limit(1)
-    )
-    top_image = img_result.scalar_one_or_none()
-
-    read = ClusterRead(
-        cluster_id=cluster.cluster_id,
-        canonical_title=cluster.canonical_title,
-        canonical_url=cluster.canonical_url,
-        top_country=cluster.top_country,
-        top_category=cluster.top_category,
-        tags_json=cluster.tags_json or [],
-        ai_summary=cluster.ai_summary,
-        ai_key_points_json=cluster.ai_key_points_json or [],
-        ai_entities_json=cluster.ai_entities_json or {},
-        why_trending=cluster.why_trending,
-        score=cluster.score,
-        last_updated=cluster.last_updated,
-        article_count=article_count,
-        sources=sources,
-        top_image_url=top_image,
-    )
+    read = _cluster_read(*row)
 
     await cache_set(cache_key, read.model_dump(), ttl=CACHE_TTL_CLUSTER)
     return read
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import logging
-import math
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, func, and_
+import numpy as np
+from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.database import Article, Cluster, ClusterMember
@@ -20,22 +20,31 @@ def compute_trending_score(
     newest_article_age_minutes: float,
     velocity: float,  # new articles in last 30 min
 ) -> float:
-    """
-    score = w1 * log(1 + unique_sources) + w2 * recency_boost + w3 * velocity
-    recency_boost decays by minutes
-    """
-    source_score = TRENDING_W_SOURCES * math.log(1 + unique_sources)
+    """Score one cluster; see compute_trending_scores()."""
+    scores = compute_trending_scores(
+        np.array([unique_sources]), np.array([newest_article_age_minutes]), np.array([velocity])
+    )
+    return float(scores[0])
 
-    # Recency: 1.0 for <5min, decays to ~0.1 for 24h old
-    if newest_article_age_minutes <= 0:
-        recency = 1.0
-    else:
-        recency = 1.0 / (1.0 + (newest_article_age_minutes / 60.0))
-    recency_score = TRENDING_W_RECENCY * recency
 
-    velocity_score = TRENDING_W_VELOCITY * math.log(1 + velocity)
+def compute_trending_scores(
+    unique_sources: np.ndarray,
+    newest_article_age_minutes: np.ndarray,
+    velocity: np.ndarray,
+) -> np.ndarray:
+    """
+    score = w1 * log(1 + unique_sources) + w2 * recency_boost + w3 * log(1 + velocity)
+    recency_boost decays by minutes: 1.0 when fresh, ~0.04 at 24h
 
-    return round(source_score + recency_score + velocity_score, 4)
+    Takes aligned per-cluster arrays and returns scores rounded to 4 places.
+    """
+    age = np.maximum(np.asarray(newest_article_age_minutes, dtype=np.float64), 0.0)
+    scores = (
+        TRENDING_W_SOURCES * np.log1p(np.asarray(unique_sources, dtype=np.float64))
+        + TRENDING_W_RECENCY / (1.0 + age / 60.0)
+        + TRENDING_W_VELOCITY * np.log1p(np.asarray(velocity, dtype=np.float64))
+    )
+    return np.round(scores, 4)
 
 
 async def update_trending_scores(db: AsyncSession) -> int:
@@ -44,50 +53,85 @@ async def update_trending_scores(db: AsyncSession) -> int:
     cutoff = now - timedelta(hours=48)
     velocity_window = now - timedelta(minutes=30)
 
-    # Get active clusters
-    result = await db.execute(
-        select(Cluster).where(Cluster.last_updated >= cutoff).limit(500)
+    # Active clusters first, so the stats below only aggregate their rows
+    # instead of every cluster_members / articles row ever stored
+    active = (
+        select(Cluster.cluster_id, Cluster.score)
+        .where(Cluster.last_updated >= cutoff)
+        .limit(500)
+        .cte("active")
     )
-    clusters = list(result.scalars().all())
-
-    updated = 0
-    for cluster in clusters:
-        # Count unique sources
-        src_result = await db.execute(
-            select(func.count(func.distinct(ClusterMember.source)))
-            .where(ClusterMember.cluster_id == cluster.cluster_id)
+    active_ids = select(active.c.cluster_id)
+
+    # Per-cluster stats, each aggregated once over its own table
+    src_stats = (
+        select(
+            ClusterMember.cluster_id,
+            func.count(func.distinct(ClusterMember.source)).label("unique_sources"),
         )
-        unique_sources = src_result.scalar() or 1
+        .where(ClusterMember.cluster_id.in_(active_ids))
+        .group_by(ClusterMember.cluster_id)
+        .subquery()
+    )
+    art_stats = (
+        select(
+            Article.cluster_id,
+            func.max(Article.published_at).label("newest_at"),
+            func.count(Article.id)
+            .filter(Article.fetched_at >= velocity_window)
+            .label("velocity"),
+        )
+        .where(Article.cluster_id.in_(active_ids))
+        .group_by(Article.cluster_id)
+        .subquery()
+    )
 
-        # Get newest article timestamp
-        newest_result = await db.execute(
-            select(func.max(Article.published_at))
-            .where(Article.cluster_id == cluster.cluster_id)
+    # Get active clusters together with their stats in one round-trip
+    result = await db.execute(
+        select(
+            active.c.cluster_id,
+            active.c.score,
+            src_stats.c.unique_sources,
+            art_stats.c.newest_at,
+            art_stats.c.velocity,
         )
-        newest_at = newest_result.scalar()
+        .outerjoin(src_stats, src_stats.c.cluster_id == active.c.cluster_id)
+        .outerjoin(art_stats, art_stats.c.cluster_id == active.c.cluster_id)
+    )
+
+    rows = result.all()
+    if rows:
+        cluster_ids, old_scores, unique_sources, newest_ats, velocities = zip(*rows)
+    else:
+        cluster_ids = old_scores = unique_sources = newest_ats = velocities = ()
+
+    # Ages in minutes; clusters with no articles fall back to 24h
+    ages = []
+    for newest_at in newest_ats:
         if newest_at:
             if newest_at.tzinfo is None:
                 newest_at = newest_at.replace(tzinfo=timezone.utc)
-            age_minutes = max(0, (now - newest_at).total_seconds() / 60.0)
+            ages.append((now - newest_at).total_seconds() / 60.0)
         else:
-            age_minutes = 1440  # 24h fallback
-
-        # Velocity: articles added in last 30 min
-        vel_result = await db.execute(
-            select(func.count(Article.id))
-            .where(
-                and_(
-                    Article.cluster_id == cluster.cluster_id,
-                    Article.fetched_at >= velocity_window,
-                )
-            )
-        )
-        velocity = vel_result.scalar() or 0
+            ages.append(1440.0)
 
-        new_score = compute_trending_score(unique_sources, age_minutes, velocity)
-        cluster.score = new_score
-        updated += 1
+    scores = compute_trending_scores(
+        np.array([u or 1 for u in unique_sources], dtype=np.float64),
+        np.array(ages, dtype=np.float64),
+        np.array([v or 0 for v in velocities], dtype=np.float64),
+    )
 
+    changes = [
+        {"cluster_id": cluster_id, "score": new_score}
+        for cluster_id, old_score, new_score in zip(cluster_ids, old_scores, scores.tolist())
+        if new_score != old_score
+    ]
+    updated = len(rows)
+
+    # One executemany UPDATE keyed by primary key; unchanged rows are skipped
+    # (as the ORM flush did), so their last_updated isn't bumped
+    if changes:
+        await db.execute(update(Cluster), changes)
     await db.commit()
     logger.info(f"Updated trending scores for {updated} clusters")
     return updated
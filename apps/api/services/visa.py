@@ -6,13 +6,43 @@ Uses mTLS when credentials are configured; returns realistic demo data otherwise
 from __future__ import annotations
 
 import logging
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
+
+import httpx
+import orjson
 
 from apps.api.config import get_settings
 from apps.api.redis_client import cache_get, cache_set
 
 logger = logging.getLogger("aion.visa")
 
+# Shared mTLS client — the cert/key load and TLS handshake happen once per
+# process instead of once per Visa call
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        s = get_settings()
+        _client = httpx.AsyncClient(
+            cert=(s.visa_cert_path, s.visa_key_path),
+            verify=s.visa_ca_cert_path or True,
+            auth=(s.visa_user_id, s.visa_password),
+            timeout=15.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+
 # ── Demo data ────────────────────────────────────────────────────
 
 DEMO_FX_RATES: list[dict[str, Any]] = [
@@ -57,6 +87,25 @@ CACHE_TTL_SPEND = 600    # 10 minutes
 CACHE_TTL_VOLUME = 600   # 10 minutes
 
 
+# ── Precomputed demo payloads ────────────────────────────────────
+# Without credentials every request is served demo data; serialize each
+# payload once and let the routes return the bytes directly.
+
+@lru_cache(maxsize=256)
+def demo_fx_rates_json(source: str) -> bytes:
+    return orjson.dumps({"source": source, "rates": DEMO_FX_RATES, "demo": True})
+
+
+@lru_cache(maxsize=256)
+def demo_spend_insights_json(country: str) -> bytes:
+    return orjson.dumps({"country": country, "insights": DEMO_SPEND_INSIGHTS, "demo": True})
+
+
+@lru_cache(maxsize=1)
+def demo_payment_volume_json() -> bytes:
+    return orjson.dumps({"months": DEMO_PAYMENT_VOLUME, "demo": True})
+
+
 def is_configured() -> bool:
     """Check if Visa API credentials are present."""
     s = get_settings()
@@ -65,21 +114,13 @@ def is_configured() -> bool:
 
 async def _call_visa_api(path: str) -> dict[str, Any]:
     """Make an authenticated mTLS request to the Visa sandbox."""
-    import httpx
-
     s = get_settings()
     url = f"{s.visa_base_url}{path}"
     logger.info("Visa API call: %s", url)
 
-    async with httpx.AsyncClient(
-        cert=(s.visa_cert_path, s.visa_key_path),
-        verify=s.visa_ca_cert_path or True,
-        auth=(s.visa_user_id, s.visa_password),
-        timeout=15.0,
-    ) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.json()
+    resp = await _get_client().get(url)
+    resp.raise_for_status()
+    return resp.json()
 
 
 async def get_fx_rates(source: str = "USD") -> dict[str, Any]:
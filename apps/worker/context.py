@@ -0,0 +1,29 @@
+"""Shared dependencies for worker loops and tasks, resolved once at startup."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from apps.api.ai.router import AIRouter, get_ai_router
+from apps.api.config import Settings, get_settings
+from apps.api.database import get_session_factory
+from apps.api.providers.router import ProviderRouter, get_provider_router
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerContext:
+    settings: Settings
+    factory: async_sessionmaker
+    ai: AIRouter
+    providers: ProviderRouter
+
+    @classmethod
+    def create(cls) -> WorkerContext:
+        return cls(
+            settings=get_settings(),
+            factory=get_session_factory(),
+            ai=get_ai_router(),
+            providers=get_provider_router(),
+        )
@@ -1,28 +1,51 @@
-"""AiON Worker — background job runner with simple loop."""
+"""AiON Worker — background job runner with a single interval scheduler."""
 
 from __future__ import annotations
 
 import asyncio
 import logging
-import sys
+import signal
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
-from apps.api.config import get_settings
-from apps.api.database import init_db, close_db, get_session_factory
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.api.database import init_db, close_db
+from apps.api.logging_config import configure_logging
 from apps.api.redis_client import publish_event
+from apps.api.services import embeddings
 from apps.api.services.clustering import cluster_articles
 from apps.api.services.trending import update_trending_scores
+from apps.worker.context import WorkerContext
 from apps.worker.tasks.enrich import enrich_clusters
 from apps.worker.tasks.ingest import ingest_news
 from apps.worker.tasks.notify import generate_notifications
 
 # ── Logging ──────────────────────────────────────────────────────
-logging.basicConfig(
-    level=logging.INFO,
-    format='{"time":"%(asctime)s","level":"%(levelname)s","logger":"%(name)s","msg":"%(message)s"}',
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+configure_logging()
 logger = logging.getLogger("worker")
 
+# Set on SIGTERM/SIGINT; the scheduler exits at its next wait instead of sleeping it out
+shutdown = asyncio.Event()
+
+NOTIFY_INTERVAL_SECONDS = 60
+
+
+def request_shutdown():
+    """Stop the scheduler after the job it is currently running."""
+    logger.info("Worker shutting down...")
+    shutdown.set()
+
+
+async def sleep_unless_shutdown(interval: float) -> bool:
+    """Sleep for interval seconds; returns False early if shutdown is requested."""
+    try:
+        await asyncio.wait_for(shutdown.wait(), timeout=interval)
+        return False
+    except TimeoutError:
+        return True
+
 
 async def run_task(name: str, coro):
     """Run a task with error handling."""
@@ -35,60 +58,78 @@ async def run_task(name: str, coro):
         return None
 
 
-async def ingest_loop(interval: int):
-    """Periodically ingest news from providers."""
-    factory = get_session_factory()
-    while True:
-        try:
-            async with factory() as db:
-                await run_task("ingest", ingest_news(db))
-        except Exception as e:
-            logger.error(f"Ingest loop error: {e}")
-        await asyncio.sleep(interval)
+@dataclass(slots=True)
+class Job:
+    name: str
+    interval: float
+    run: Callable[[AsyncSession], Awaitable[None]]
+    next_run: float = 0.0
 
 
-async def cluster_loop(interval: int):
-    """Periodically cluster articles and update trending scores."""
-    factory = get_session_factory()
-    while True:
-        try:
-            async with factory() as db:
-                await run_task("clustering", cluster_articles(db))
-                await run_task("trending", update_trending_scores(db))
-
-                # Publish feed update events for active channels
-                await publish_event(
-                    channel="*:*:trending",
-                    event_type="feed_refresh",
-                    data={"reason": "trending_update"},
-                )
-        except Exception as e:
-            logger.error(f"Cluster loop error: {e}")
-        await asyncio.sleep(interval)
+async def scheduler_loop(ctx: WorkerContext):
+    """Run every job on its own interval from a single task and session.
 
+    Stages still hand off work: new articles make clustering due immediately,
+    and newly clustered articles make enrichment due.
+    """
+    settings = ctx.settings
 
-async def enrich_loop(interval: int):
-    """Periodically enrich clusters with AI summaries."""
-    factory = get_session_factory()
-    while True:
-        try:
-            async with factory() as db:
-                await run_task("enrich", enrich_clusters(db))
-        except Exception as e:
-            logger.error(f"Enrich loop error: {e}")
-        await asyncio.sleep(interval)
+    async def ingest(db: AsyncSession):
+        stored = await run_task("ingest", ingest_news(db, ctx))
+        if stored:
+            jobs["cluster"].next_run = 0.0
+
+    async def cluster(db: AsyncSession):
+        clustered = await run_task("clustering", cluster_articles(db))
+        if clustered:
+            jobs["enrich"].next_run = 0.0
+        await run_task("trending", update_trending_scores(db))
 
+        # Publish feed update events for active channels
+        await publish_event(
+            channel="*:*:trending",
+            event_type="feed_refresh",
+            data={"reason": "trending_update"},
+        )
 
-async def notify_loop(interval: int):
-    """Periodically generate notifications for users based on their preferences."""
-    factory = get_session_factory()
-    while True:
+    async def enrich(db: AsyncSession):
+        await run_task("enrich", enrich_clusters(db, ctx))
+
+    async def notify(db: AsyncSession):
+        await run_task("notify", generate_notifications(db))
+
+    # Ingest and notify run at startup; clustering and enrichment wait for
+    # work from the previous stage (or their first interval)
+    start = time.monotonic()
+    jobs = {
+        "ingest": Job("ingest", settings.ingest_interval_seconds, ingest),
+        "cluster": Job("cluster", settings.trending_interval_seconds, cluster,
+                       start + settings.trending_interval_seconds),
+        "enrich": Job("enrich", settings.enrich_interval_seconds, enrich,
+                      start + settings.enrich_interval_seconds),
+        "notify": Job("notify", NOTIFY_INTERVAL_SECONDS, notify),
+    }
+
+    while not shutdown.is_set():
+        # Pipeline order, so a stage triggered this tick runs right after its producer
         try:
-            async with factory() as db:
-                await run_task("notify", generate_notifications(db))
+            async with ctx.factory() as db:
+                for job in jobs.values():
+                    if shutdown.is_set() or job.next_run > time.monotonic():
+                        continue
+                    try:
+                        await job.run(db)
+                    except Exception as e:
+                        logger.error(f"{job.name} job error: {e}")
+                    # A failed job must not leave the shared session unusable
+                    await db.rollback()
+                    job.next_run = time.monotonic() + job.interval
         except Exception as e:
-            logger.error(f"Notify loop error: {e}")
-        await asyncio.sleep(interval)
+            logger.error(f"Scheduler error: {e}")
+
+        delay = min(job.next_run for job in jobs.values()) - time.monotonic()
+        if not await sleep_unless_shutdown(max(delay, 0.0)):
+            break
 
 
 async def health_server():
@@ -111,24 +152,28 @@ async def health_server():
 
 async def main():
     logger.info("Starting AiON Worker...")
-    settings = get_settings()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, request_shutdown)
+
+    # Start tasks eagerly where supported (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
 
     # Initialize database
     await init_db()
     logger.info("Database initialized")
+    ctx = WorkerContext.create()
 
-    # Run all loops concurrently (+ health endpoint for Render free tier)
+    # Health endpoint for Render free tier, then the job scheduler
     try:
-        await asyncio.gather(
-            health_server(),
-            ingest_loop(settings.ingest_interval_seconds),
-            cluster_loop(settings.trending_interval_seconds),
-            enrich_loop(settings.enrich_interval_seconds),
-            notify_loop(60),
-        )
+        await health_server()
+        await scheduler_loop(ctx)
     except KeyboardInterrupt:
-        logger.info("Worker shutting down...")
+        request_shutdown()
     finally:
+        await embeddings.close_client()
         await close_db()
 
 
@@ -7,29 +7,35 @@ Uses two separate AI providers for different tasks:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, and_
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from apps.api.ai.router import get_ai_router
 from apps.api.database import Article, Cluster
-from apps.api.redis_client import publish_event
+from apps.api.redis_client import publish_events
+from apps.worker.context import WorkerContext
 
 logger = logging.getLogger(__name__)
 
+# Newest articles per cluster included in the prompts
+MAX_ARTICLES_PER_CLUSTER = 10
+# How long a worker's claim on a cluster holds before others may retry it
+CLAIM_TTL = timedelta(minutes=5)
 
-async def enrich_clusters(db: AsyncSession, batch_size: int = 10):
+
+async def enrich_clusters(db: AsyncSession, ctx: WorkerContext, batch_size: int = 10):
     """Find clusters without AI summary and enrich them.
 
-    Runs two AI calls per cluster:
-      1. summarize_cluster() -> Claude (primary) for summary, key_points, entities
-      2. analyze_trending()  -> OpenAI (primary) for why_trending, tags, sentiment
+    Runs two batched AI calls per cycle (all clusters in one prompt each):
+      1. summarize_clusters()     -> Claude (primary) for summary, key_points, entities
+      2. analyze_trending_batch() -> OpenAI (primary) for why_trending, tags, sentiment
 
     Only enriches clusters with 2+ articles (worth summarizing).
     """
-    from sqlalchemy import func
-
     # Find un-enriched clusters with articles
     subq = (
         select(Article.cluster_id, func.count(Article.id).label("cnt"))
@@ -38,84 +44,151 @@ async def enrich_clusters(db: AsyncSession, batch_size: int = 10):
         .subquery()
     )
 
+    # Claim candidates: rows another worker holds are skipped, and a claim
+    # expires after CLAIM_TTL in case that worker died mid-batch. Only the
+    # columns the prompt and SSE event need; results are written back with
+    # one bulk UPDATE below.
+    now = datetime.now(timezone.utc)
     result = await db.execute(
-        select(Cluster)
+        select(
+            Cluster.cluster_id,
+            Cluster.canonical_title,
+            Cluster.top_country,
+            Cluster.top_category,
+            Cluster.score,
+        )
         .join(subq, Cluster.cluster_id == subq.c.cluster_id)
         .where(Cluster.ai_summary.is_(None))
+        .where(or_(Cluster.claimed_at.is_(None), Cluster.claimed_at < now - CLAIM_TTL))
         .order_by(Cluster.score.desc())
         .limit(batch_size)
+        .with_for_update(of=Cluster, skip_locked=True)
     )
-    clusters = list(result.scalars().all())
+    clusters = result.all()
+
+    if clusters:
+        await db.execute(
+            update(Cluster)
+            .where(Cluster.cluster_id.in_([c.cluster_id for c in clusters]))
+            .values(claimed_at=now, last_updated=Cluster.last_updated)
+        )
+    await db.commit()
 
     if not clusters:
         logger.debug("No clusters to enrich")
         return 0
 
-    ai = get_ai_router()
-    enriched = 0
+    # Newest 10 articles of every cluster in one query, bucketed per cluster
+    ranked = (
+        select(
+            Article.cluster_id,
+            Article.title,
+            Article.raw_snippet,
+            Article.source,
+            func.row_number()
+            .over(partition_by=Article.cluster_id, order_by=Article.published_at.desc())
+            .label("rn"),
+        )
+        .where(Article.cluster_id.in_([c.cluster_id for c in clusters]))
+        .subquery()
+    )
+    arts_result = await db.execute(
+        select(ranked.c.cluster_id, ranked.c.title, ranked.c.raw_snippet, ranked.c.source)
+        .where(ranked.c.rn <= MAX_ARTICLES_PER_CLUSTER)
+        .order_by(ranked.c.cluster_id, ranked.c.rn)
+    )
+    buckets: dict[int, list] = defaultdict(list)
+    for row in arts_result.all():
+        buckets[row.cluster_id].append(row)
 
-    for cluster in clusters:
-        try:
-            # Get cluster's articles
-            arts_result = await db.execute(
-                select(Article)
-                .where(Article.cluster_id == cluster.cluster_id)
-                .order_by(Article.published_at.desc())
-                .limit(10)
-            )
-            articles = list(arts_result.scalars().all())
-
-            if not articles:
-                continue
-
-            titles = [a.title for a in articles]
-            snippets = [a.raw_snippet or "" for a in articles]
-            sources = [a.source for a in articles]
-
-            # Step 1: Claude -> Summarization (summary, key_points, entities)
-            summary_resp = await ai.summarize_cluster(titles, snippets, sources)
-            cluster.ai_summary = summary_resp.summary
-            cluster.ai_key_points_json = summary_resp.key_points
-            cluster.ai_entities_json = summary_resp.entities
-
-            # Step 2: OpenAI -> Trending analysis (why_trending, tags, sentiment)
-            trending_resp = await ai.analyze_trending(titles, snippets, sources)
-            cluster.why_trending = trending_resp["why_trending"]
-            cluster.tags_json = trending_resp.get("tags", [])
-
-            # Store extra trending metadata
-            cluster.metadata_json = {
-                "sentiment": trending_resp.get("sentiment", "neutral"),
-                "impact_score": trending_resp.get("impact_score", 5),
-                "summary_provider": "anthropic",
-                "trending_provider": trending_resp.get("ai_provider", "openai"),
-            }
-
-            enriched += 1
-
-            # Publish SSE event for this cluster update
-            await publish_event(
-                channel=f"{cluster.top_country}:{cluster.top_category}:trending",
-                event_type="cluster_update",
-                data={
-                    "cluster_id": cluster.cluster_id,
-                    "title": cluster.canonical_title,
-                    "summary": summary_resp.summary,
-                    "why_trending": trending_resp["why_trending"],
-                    "tags": trending_resp.get("tags", []),
-                    "score": cluster.score,
-                },
-            )
-
-            logger.info(
-                f"Enriched cluster {cluster.cluster_id}: "
-                f"summary via Claude, trending via OpenAI"
-            )
+    work = [
+        (cluster, buckets[cluster.cluster_id])
+        for cluster in clusters
+        if buckets[cluster.cluster_id]
+    ]
+
+    if not work:
+        return 0
 
+    batch = [
+        (
+            [a.title for a in articles],
+            [a.raw_snippet or "" for a in articles],
+            [a.source for a in articles],
+        )
+        for _, articles in work
+    ]
+
+    # Both providers work on the whole batch at the same time
+    async with asyncio.TaskGroup() as tg:
+        summaries_task = tg.create_task(ctx.ai.summarize_clusters(batch))
+        trending_task = tg.create_task(ctx.ai.analyze_trending_batch(batch))
+    summaries, trends = summaries_task.result(), trending_task.result()
+
+    updates = []
+    for (cluster, _), summary_resp, trending_resp in zip(work, summaries, trends):
+        if summary_resp is None:
+            # No provider summarized it: leave ai_summary empty so the cluster
+            # is claimed again once CLAIM_TTL expires
+            continue
+        try:
+            updates.append(_enrichment_values(cluster.cluster_id, summary_resp, trending_resp))
         except Exception as e:
             logger.error(f"Failed to enrich cluster {cluster.cluster_id}: {e}")
-            continue
 
+    if updates:
+        await db.execute(update(Cluster), updates)
     await db.commit()
+
+    # Announce only after the rows are committed, so clients refetch fresh data
+    enriched_ids = {u["cluster_id"] for u in updates}
+    await publish_events([
+        _update_event(cluster, summary_resp, trending_resp)
+        for (cluster, _), summary_resp, trending_resp in zip(work, summaries, trends)
+        if cluster.cluster_id in enriched_ids
+    ])
+
+    enriched = len(updates)
     logger.info(f"Enriched {enriched} clusters (Claude summaries + OpenAI trending)")
     return enriched
+
+
+def _enrichment_values(cluster_id: int, summary_resp, trending_resp: dict) -> dict:
+    """Column values for one cluster's AI results (a bulk UPDATE parameter set)."""
+    return {
+        "cluster_id": cluster_id,
+        # Step 1: Claude -> Summarization (summary, key_points, entities)
+        "ai_summary": summary_resp.summary,
+        "ai_key_points_json": summary_resp.key_points,
+        "ai_entities_json": summary_resp.entities,
+        # Step 2: OpenAI -> Trending analysis (why_trending, tags, sentiment)
+        "why_trending": trending_resp["why_trending"],
+        "tags_json": trending_resp.get("tags", []),
+        # Extra trending metadata
+        "metadata_json": {
+            "sentiment": trending_resp.get("sentiment", "neutral"),
+            "impact_score": trending_resp.get("impact_score", 5),
+            "summary_provider": "anthropic",
+            "trending_provider": trending_resp.get("ai_provider", "openai"),
+        },
+    }
+
+
+def _update_event(cluster, summary_resp, trending_resp: dict) -> tuple[str, str, dict]:
+    """The (channel, event_type, data) SSE event for one enriched cluster."""
+    logger.info(
+        f"Enriched cluster {cluster.cluster_id}: "
+        f"summary via Claude, trending via OpenAI"
+    )
+    return (
+        f"{cluster.top_country}:{cluster.top_category}:trending",
+        "cluster_update",
+        {
+            "cluster_id": cluster.cluster_id,
+            "title": cluster.canonical_title,
+            "summary": summary_resp.summary,
+            "why_trending": trending_resp["why_trending"],
+            "tags": trending_resp.get("tags", []),
+            "score": cluster.score,
+        },
+    )
@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from apps.api.providers.router import get_provider_router
+from apps.api.redis_client import advance_cursor
 from apps.api.services.clustering import deduplicate_and_store
-from packages.shared.constants import CATEGORIES, COUNTRIES
+from apps.worker.context import WorkerContext
+from packages.shared.constants import CATEGORIES, COUNTRY_CODES
+from packages.shared.schemas import normalize_title
 
 logger = logging.getLogger(__name__)
 
-# Rotate through countries to spread API calls
+# Rotate through countries to spread API calls. The cursor lives in Redis so
+# several worker replicas take turns; _country_index is the no-Redis fallback.
+COUNTRIES_PER_CYCLE = 3
 _country_index = 0
 
+# Provider fan-outs in flight at once
+INGEST_CONCURRENCY = 10
 
-async def ingest_news(db: AsyncSession, countries: list[str] | None = None, categories: list[str] | None = None):
+
+async def ingest_news(
+    db: AsyncSession,
+    ctx: WorkerContext,
+    countries: Sequence[str] | None = None,
+    categories: Sequence[str] | None = None,
+):
     """Fetch news from all providers and store in database.
 
     Cycles through country/category combinations to spread API load.
@@ -24,35 +38,64 @@ async def ingest_news(db: AsyncSession, countries: list[str] | None = None, cate
     global _country_index
 
     if countries is None:
-        all_countries = list(COUNTRIES.keys())
         # Process 3 countries per cycle to avoid rate limits
-        start = _country_index
-        end = min(start + 3, len(all_countries))
-        countries = all_countries[start:end]
-        _country_index = end if end < len(all_countries) else 0
+        cursor = await advance_cursor("ingest:country", COUNTRIES_PER_CYCLE)
+        if cursor is None:
+            cursor = _country_index
+            _country_index = (cursor + COUNTRIES_PER_CYCLE) % len(COUNTRY_CODES)
+        start = cursor % len(COUNTRY_CODES)
+        countries = (COUNTRY_CODES + COUNTRY_CODES)[start:start + COUNTRIES_PER_CYCLE]
 
     if categories is None:
         categories = CATEGORIES
 
-    router = get_provider_router()
-    total_stored = 0
+    router = ctx.providers
+    sem = asyncio.Semaphore(INGEST_CONCURRENCY)
 
-    for country in countries:
-        for category in categories:
+    async def _fetch(country: str, category: str):
+        async with sem:
             try:
                 articles, providers_used = await router.fetch_all_sources(
                     country=country, category=category, page_size=20
                 )
-                if articles:
-                    stored = await deduplicate_and_store(db, articles)
-                    total_stored += len(stored)
-                    logger.info(
-                        f"Ingested {len(stored)} articles for {country}/{category} "
-                        f"from {providers_used}"
-                    )
             except Exception as e:
                 logger.error(f"Ingest failed for {country}/{category}: {e}")
-                continue
+                return country, category, [], []
+        return country, category, articles, providers_used
+
+    # Fetch concurrently; store each batch as it arrives (one writer, one session)
+    total_stored = 0
+    # (normalized title, source) pairs already handled this cycle: the same
+    # story comes back from several country/category fetches, and dropping
+    # repeats here skips hashing them and re-checking them against the DB
+    seen: set[tuple[str, str]] = set()
+    tasks = [_fetch(country, category) for country in countries for category in categories]
+    for next_done in asyncio.as_completed(tasks):
+        country, category, articles, providers_used = await next_done
+        fresh = []
+        for art in articles:
+            key = (normalize_title(art.title), art.source)
+            if key not in seen:
+                seen.add(key)
+                fresh.append(art)
+        if not fresh:
+            continue
+        articles = fresh
+        try:
+            stored = await deduplicate_and_store(db, articles)
+            total_stored += len(stored)
+            logger.info(
+                f"Ingested {len(stored)} articles for {country}/{category} "
+                f"from {providers_used}"
+            )
+        except Exception as e:
+            logger.error(f"Ingest failed for {country}/{category}: {e}")
 
-    logger.info(f"Ingest cycle complete: {total_stored} new articles stored")
+    # Hit rate of the title-normalization LRU is reported for sizing it
+    cache = normalize_title.cache_info()
+    logger.info(
+        f"Ingest cycle complete: {total_stored} new articles stored "
+        f"(normalize_title cache: {cache.hits} hits, {cache.misses} misses, "
+        f"{cache.currsize}/{cache.maxsize} entries)"
+    )
     return total_stored
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.api.database import Article, Notification, UserPreference
@@ -18,19 +20,26 @@ MAX_NOTIFICATIONS_PER_BATCH = 5
 async def generate_notifications(db: AsyncSession) -> int:
     """Check all users with preferences and create notifications for new matching articles."""
     now = datetime.now(timezone.utc)
-    created_count = 0
 
-    # Fetch all user preferences that have at least one category
+    # Fetch all user preferences that have at least one category (narrow columns only)
     result = await db.execute(
-        select(UserPreference).where(
+        select(
+            UserPreference.id,
+            UserPreference.user_id,
+            UserPreference.categories,
+            UserPreference.countries,
+            UserPreference.notification_interval,
+            UserPreference.last_notified_at,
+        ).where(
             UserPreference.categories != None,  # noqa: E711
         )
     )
-    all_prefs = result.scalars().all()
+    all_prefs = result.all()
 
+    # Users due a notification, with the window each one still needs
+    due = []
     for prefs in all_prefs:
         categories = prefs.categories or []
-        countries = prefs.countries or []
         interval = prefs.notification_interval or 15
 
         # Skip users with no categories set
@@ -45,44 +54,78 @@ async def generate_notifications(db: AsyncSession) -> int:
 
         # Find articles since last notification (or last 30 minutes for new users)
         since = prefs.last_notified_at or (now - timedelta(minutes=30))
+        due.append((prefs, since))
 
-        # Build query for matching articles
+    rows: list[dict] = []
+    notified: list[dict] = []
+
+    # Users with the same categories and countries share one query. Results
+    # are newest first, so the newest MAX_NOTIFICATIONS_PER_BATCH since the
+    # group's earliest window contain every member's own newest matches
+    groups: dict[tuple[frozenset, frozenset], list] = defaultdict(list)
+    for prefs, since in due:
+        key = (frozenset(prefs.categories), frozenset(prefs.countries or []))
+        groups[key].append((prefs, since))
+
+    for (categories, countries), members in groups.items():
         conditions = [
-            Article.fetched_at > since,
-            Article.category.in_(categories),
+            Article.fetched_at > min(since for _, since in members),
+            Article.category.in_(sorted(categories)),
         ]
         if countries:
-            conditions.append(Article.country.in_(countries))
-
+            conditions.append(Article.country.in_(sorted(countries)))
         articles_result = await db.execute(
-            select(Article)
+            select(
+                Article.id,
+                Article.cluster_id,
+                Article.title,
+                Article.raw_snippet,
+                Article.category,
+                Article.country,
+                Article.fetched_at,
+            )
             .where(and_(*conditions))
             .order_by(Article.fetched_at.desc())
             .limit(MAX_NOTIFICATIONS_PER_BATCH)
         )
-        articles = articles_result.scalars().all()
-
-        if not articles:
-            continue
+        candidates = articles_result.all()
 
-        # Create notification rows
-        for article in articles:
-            notif = Notification(
-                user_id=prefs.user_id,
-                article_id=article.id,
-                cluster_id=article.cluster_id,
-                title=article.title,
-                body=article.raw_snippet[:200] if article.raw_snippet else None,
-                category=article.category,
-                country=article.country,
-            )
-            db.add(notif)
-            created_count += 1
-
-        # Update last_notified_at
-        prefs.last_notified_at = now
+        for prefs, since in members:
+            articles = [a for a in candidates if a.fetched_at > since]
+            if not articles:
+                continue
 
+            # Collect notification rows for one bulk insert
+            for article in articles:
+                rows.append({
+                    "user_id": prefs.user_id,
+                    "article_id": article.id,
+                    "cluster_id": article.cluster_id,
+                    "title": article.title,
+                    "body": article.raw_snippet[:200] if article.raw_snippet else None,
+                    "category": article.category,
+                    "country": article.country,
+                })
+
+            # Update last_notified_at
+            notified.append({"id": prefs.id, "last_notified_at": now})
+
+    if rows:
+        # Overlapping runs may pick the same articles; the unique
+        # (user_id, article_id) index lets the database drop repeats.
+        result = await db.execute(
+            pg_insert(Notification)
+            .on_conflict_do_nothing(index_elements=["user_id", "article_id"])
+            .returning(Notification.id),
+            rows,
+        )
+        created_count = len(result.all())
+    else:
+        created_count = 0
+    if notified:
+        await db.execute(update(UserPreference), notified)
     await db.commit()
+
     if created_count > 0:
         logger.info(f"Created {created_count} notifications for {len(all_prefs)} users")
     return created_count
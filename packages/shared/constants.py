@@ -1,5 +1,7 @@
 """Shared constants for AiON."""
 
+from typing import Final
+
 # ── Countries (40+, including Nepal) ─────────────────────────────
 COUNTRIES = {
     # South Asia
@@ -61,8 +63,10 @@ COUNTRIES = {
     "GH": "Ghana",
 }
 
+COUNTRY_CODES: tuple[str, ...] = tuple(COUNTRIES)
+
 # ── Categories (35 total) ────────────────────────────────────────
-CATEGORIES = [
+CATEGORIES: tuple[str, ...] = (
     # Core news
     "general",
     "world",
@@ -105,7 +109,7 @@ CATEGORIES = [
     "media",
     "opinion",
     "weather",
-]
+)
 
 CATEGORY_LABELS = {
     "general": "General",
@@ -194,9 +198,9 @@ CACHE_TTL_EXPLAIN = 600       # 10 min for AI explanations
 CACHE_TTL_META = 3600         # 1 hour for metadata
 
 # Circuit breaker
-CIRCUIT_BREAKER_THRESHOLD = 3      # failures before opening
-CIRCUIT_BREAKER_COOLDOWN = 60      # seconds to wait before half-open
-CIRCUIT_BREAKER_HALF_OPEN_MAX = 1  # requests to allow in half-open
+CIRCUIT_BREAKER_THRESHOLD: Final[int] = 3      # failures before opening
+CIRCUIT_BREAKER_COOLDOWN: Final[int] = 60      # seconds to wait before half-open
+CIRCUIT_BREAKER_HALF_OPEN_MAX: Final[int] = 1  # requests to allow in half-open
 
 # Trending score weights
 TRENDING_W_SOURCES = 3.0    # weight for unique source count
@@ -212,3 +216,5 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSIONS = 256
 EMBEDDING_SIMILARITY_THRESHOLD = 0.82
 EMBEDDING_BATCH_SIZE = 50
+EMBEDDING_MAX_CONCURRENCY = 8   # in-flight embedding batches per call
+CENTROID_SAMPLE_SIZE = 20       # member embeddings averaged into a cluster centroid
@@ -2,54 +2,94 @@
 
 from __future__ import annotations
 
-import hashlib
 import re
+import sys
 import unicodedata
 from datetime import datetime
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import xxhash
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, computed_field
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
+_PUNCT = re.compile(r"[^\w\s]")
+# ASCII titles (the common case): NFKD is a no-op and punctuation is dropped
+# with one translate(). Both paths collapse whitespace with split/join, which
+# splits on exactly the characters \s matches.
+_ASCII_PUNCT = str.maketrans({
+    c: None for c in map(chr, range(128)) if _PUNCT.fullmatch(c)
+})
+
+
+@lru_cache(maxsize=65536)
 def normalize_title(title: str) -> str:
-    """Normalize a title for dedup comparison."""
-    t = unicodedata.normalize("NFKD", title.lower().strip())
-    t = re.sub(r"[^\w\s]", "", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    """Normalize a title for dedup comparison.
+
+    Cached: the same headline arrives from several providers per cycle.
+    """
+    if title.isascii():
+        return " ".join(title.lower().translate(_ASCII_PUNCT).split())
+    t = _PUNCT.sub("", unicodedata.normalize("NFKD", title.lower()))
+    return " ".join(t.split())
+
 
+# Recorded as the comment on articles.hash; init_db rehashes stored articles
+# once whenever it differs, so change it together with make_article_hash.
+ARTICLE_HASH_SCHEME = "xxh3_128(normalize_title(title)|source)"
 
+
+@lru_cache(maxsize=65536)
 def make_article_hash(title: str, source: str) -> str:
-    """Create a dedup hash from normalized title + source."""
+    """Create a dedup hash from normalized title + source (32 hex chars).
+
+    Cached on the raw pair: most of each cycle's articles were already
+    fetched in earlier cycles, so a repeat costs one dict probe.
+    """
     norm = normalize_title(title)
-    return hashlib.sha256(f"{norm}|{source}".encode()).hexdigest()[:32]
+    return xxhash.xxh3_128_hexdigest(f"{norm}|{source}".encode())
 
 
 # ── Article ──────────────────────────────────────────────────────────
+# Low-cardinality labels repeated across thousands of articles per cycle:
+# interning shares one string object per distinct value
+Interned = Annotated[str, AfterValidator(sys.intern)]
+
+
 class ArticleBase(BaseModel):
-    provider: str
-    source: str
+    provider: Interned
+    source: Interned
     title: str
     url: str
     published_at: Optional[datetime] = None
-    country: str = "US"
-    language: str = "en"
+    country: Interned = "US"
+    language: Interned = "en"
     raw_snippet: Optional[str] = None
     image_url: Optional[str] = None
-    category: str = "general"
+    category: Interned = "general"
 
 
 class ArticleCreate(ArticleBase):
-    hash: str = ""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
+    @computed_field
+    @cached_property
+    def hash(self) -> str:
+        """Dedup hash, computed on first access and then kept on the instance."""
+        return make_article_hash(self.title, self.source)
+
+
+_ARTICLE_LIST_ADAPTER = TypeAdapter(list[ArticleCreate])
+
 
-    def model_post_init(self, __context):
-        if not self.hash:
-            self.hash = make_article_hash(self.title, self.source)
+def parse_articles(rows: list[dict]) -> list[ArticleCreate]:
+    """Validate a provider response's rows into ArticleCreate in one call."""
+    return _ARTICLE_LIST_ADAPTER.validate_python(rows)
 
 
 class ArticleRead(ArticleBase):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     cluster_id: Optional[int] = None
@@ -60,7 +100,7 @@ class ArticleRead(ArticleBase):
 
 # ── Cluster ──────────────────────────────────────────────────────────
 class ClusterRead(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     cluster_id: int
     canonical_title: str
@@ -81,6 +121,8 @@ class ClusterRead(BaseModel):
 
 # ── Feed ──────────────────────────────────────────────────────────
 class FeedItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     title: str
     source: str
@@ -96,12 +138,17 @@ class FeedItem(BaseModel):
     why_trending: Optional[str] = None
 
 
+ProviderName = Literal["newsapi", "guardian", "gdelt"]
+
+
 class FeedResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     items: list[FeedItem]
     total: int
     cursor: Optional[str] = None
     updated_at: datetime
-    sources_used: list[str] = []
+    sources_used: tuple[ProviderName, ...] = ()
     cached: bool = False
 
 
@@ -125,19 +172,19 @@ class AISummaryRequest(BaseModel):
     sources: list[str]
 
 
+def _cap_key_points(v: list[str]) -> list[str]:
+    return v[:6]
+
+
+KeyPoints = Annotated[list[str], AfterValidator(_cap_key_points)]
+
+
 class AISummaryResponse(BaseModel):
     summary: str
-    key_points: list[str] = Field(default_factory=list)
+    key_points: KeyPoints = Field(default_factory=list)
     entities: dict = Field(default_factory=dict)  # {people:[], orgs:[], places:[]}
     why_trending: str = ""
 
-    @field_validator("key_points", mode="before")
-    @classmethod
-    def limit_key_points(cls, v):
-        if isinstance(v, list):
-            return v[:6]
-        return v
-
 
 class ExplainResponse(BaseModel):
     explanation: str
@@ -252,7 +299,7 @@ class PreferencesUpdate(BaseModel):
 
 # ── Notifications ───────────────────────────────────────────────
 class NotificationRead(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     article_id: Optional[int] = None
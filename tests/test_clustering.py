@@ -1,8 +1,35 @@
 """Tests for dedup and clustering logic."""
 
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 from packages.shared.schemas import normalize_title
-from apps.api.services.clustering import title_similarity
+from apps.api.services.clustering import (
+    _fold_into_centroid,
+    _pairwise_similarity,
+    _unit,
+    _unit_embeddings,
+    title_similarity,
+)
+from apps.api.services.embeddings import compute_centroid, decode_vector, encode_vector
+
+
+def _cosine(a, b) -> float:
+    """Reference cosine similarity, computed the long way."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    denom = np.linalg.norm(a) * np.linalg.norm(b)
+    return float(a @ b / denom) if denom else 0.0
+
+
+def _clustered_embeddings(rng, centers: int, per_center: int, dim: int = 32, noise: float = 0.1):
+    """Random embeddings grouped around a few random centers."""
+    base = rng.normal(size=(centers, dim))
+    return [
+        [base[c] + rng.normal(scale=noise, size=dim) for _ in range(per_center)]
+        for c in range(centers)
+    ]
 
 
 class TestTitleSimilarity:
@@ -53,3 +80,96 @@ class TestNormalization:
         result = normalize_title("  too   many   spaces  ")
         assert "  " not in result
         assert result == "too many spaces"
+
+
+class TestEmbeddingSimilarity:
+    def test_pairwise_matches_reference_cosine(self):
+        rng = np.random.default_rng(0)
+        vectors = [list(v) for v in rng.normal(size=(6, 16)) * rng.uniform(0.1, 10, size=(6, 1))]
+        vectors[2] = None  # article without an embedding
+        articles = [SimpleNamespace(embedding=v) for v in vectors]
+        has_emb = np.array([v is not None for v in vectors])
+
+        sims = _pairwise_similarity(_unit_embeddings(articles, has_emb))
+
+        for i in range(len(vectors)):
+            assert sims[i, i] == -1.0
+            for j in range(len(vectors)):
+                if i == j:
+                    continue
+                if vectors[i] is None or vectors[j] is None:
+                    assert sims[i, j] == 0.0
+                else:
+                    assert sims[i, j] == pytest.approx(_cosine(vectors[i], vectors[j]), abs=1e-5)
+
+    def test_mismatched_dimension_scores_zero(self):
+        articles = [
+            SimpleNamespace(embedding=[1.0, 0.0, 0.0]),
+            SimpleNamespace(embedding=[1.0, 0.0]),
+            SimpleNamespace(embedding=[1.0, 1.0, 0.0]),
+        ]
+        sims = _pairwise_similarity(_unit_embeddings(articles, np.ones(3, dtype=bool)))
+        assert sims[0, 1] == 0.0
+        assert sims[0, 2] == pytest.approx(_cosine([1, 0, 0], [1, 1, 0]), abs=1e-6)
+
+    def test_centroid_matvec_matches_reference(self):
+        rng = np.random.default_rng(1)
+        groups = _clustered_embeddings(rng, centers=5, per_center=4, noise=0.5)
+        centroids = [compute_centroid(members) for members in groups]
+        matrix = np.stack([_unit(c) for c in centroids])
+
+        for article in rng.normal(size=(20, 32)):
+            sims = matrix @ _unit(article)
+            expected = [_cosine(article, c) for c in centroids]
+            np.testing.assert_allclose(sims, expected, atol=1e-5)
+            assert int(sims.argmax()) == int(np.argmax(expected))
+
+
+class TestRunningCentroid:
+    def test_first_member_becomes_centroid(self):
+        v = _unit([3.0, 4.0])
+        assert _fold_into_centroid(None, 0, v) is v
+        assert _fold_into_centroid(_unit([1.0, 0.0]), 0, v) is v
+        assert _fold_into_centroid(_unit([1.0, 0.0, 0.0]), 5, v) is v
+
+    def test_second_member_is_exact_mean(self):
+        a, b = _unit([1.0, 2.0, 3.0]), _unit([-2.0, 0.5, 1.0])
+        np.testing.assert_allclose(
+            _fold_into_centroid(a, 1, b), _unit(compute_centroid([a, b])), atol=1e-6
+        )
+
+    def test_tracks_recomputed_centroid(self):
+        rng = np.random.default_rng(2)
+        members = [_unit(v) for v in _clustered_embeddings(rng, centers=1, per_center=30)[0]]
+        centroid = None
+        for n, v in enumerate(members):
+            centroid = _fold_into_centroid(centroid, n, v)
+            expected = _unit(compute_centroid(members[: n + 1]))
+            assert _cosine(centroid, expected) > 0.9999
+            assert np.linalg.norm(centroid) == pytest.approx(1.0, abs=1e-5)
+
+
+class TestVectorCodec:
+    @pytest.mark.parametrize("scale", [1e-4, 0.05, 1.0, 250.0])
+    def test_int8_round_trip(self, scale):
+        rng = np.random.default_rng(3)
+        v = (rng.normal(size=1536) * scale).astype(np.float32)
+        encoded = encode_vector(v)
+        decoded = decode_vector(encoded)
+
+        assert decoded.dtype == np.float32
+        assert decoded.shape == v.shape
+        assert np.abs(decoded - v).max() <= encoded["s"] / 2 + 1e-6 * scale
+        assert _cosine(decoded, v) > 0.9999
+
+    def test_round_trip_edge_vectors(self):
+        for v in [np.zeros(8), np.full(8, -2.5), np.array([1e-9, -1e-9, 0.0, 5.0])]:
+            decoded = decode_vector(encode_vector(v))
+            np.testing.assert_allclose(decoded, v, atol=encode_vector(v)["s"] / 2 + 1e-9)
+
+    def test_round_trip_preserves_similarity(self):
+        rng = np.random.default_rng(4)
+        a = rng.normal(size=256)
+        b = a + rng.normal(scale=0.3, size=256)
+        decoded = _cosine(decode_vector(encode_vector(a)), decode_vector(encode_vector(b)))
+        assert decoded == pytest.approx(_cosine(a, b), abs=1e-3)
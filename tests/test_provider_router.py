@@ -12,13 +12,13 @@ class TestProviderRouterLogic:
         """Headlines should prefer NewsAPI -> Guardian -> GDELT."""
         from apps.api.providers.router import ProviderRouter
         router = ProviderRouter()
-        assert router.headlines_chain == ["newsapi", "guardian", "gdelt"]
+        assert router.headlines_chain == ("newsapi", "guardian", "gdelt")
 
     def test_trending_chain_order(self):
         """Trending should prefer GDELT -> Guardian -> NewsAPI."""
         from apps.api.providers.router import ProviderRouter
         router = ProviderRouter()
-        assert router.trending_chain == ["gdelt", "guardian", "newsapi"]
+        assert router.trending_chain == ("gdelt", "guardian", "newsapi")
 
     def test_all_providers_registered(self):
         """All three providers should be registered."""
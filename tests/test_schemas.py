@@ -1,5 +1,8 @@
 """Tests for schema validation and dedup helpers."""
 
+import re
+import unicodedata
+
 import pytest
 from packages.shared.schemas import (
     ArticleCreate,
@@ -9,10 +12,18 @@ from packages.shared.schemas import (
     FeedResponse,
     make_article_hash,
     normalize_title,
+    parse_articles,
 )
 from datetime import datetime, timezone
 
 
+def _reference_normalize(title: str) -> str:
+    """The original regex-only normalize_title, kept as the parity oracle."""
+    t = unicodedata.normalize("NFKD", title.lower().strip())
+    t = re.sub(r"[^\w\s]", "", t)
+    return re.sub(r"\s+", " ", t).strip()
+
+
 class TestNormalizeTitle:
     def test_basic_normalization(self):
         assert normalize_title("Hello World!") == "hello world"
@@ -33,6 +44,25 @@ class TestNormalizeTitle:
         result = normalize_title("café résumé")
         assert isinstance(result, str)
 
+    @pytest.mark.parametrize("title", [
+        "Hello World!",
+        "snake_case and under_scores",
+        "  tabs\tand\nnewlines\r\n  ",
+        "C++ & C# \u2014 2024's \u201cbest\u201d languages?",
+        "caf\u00e9 r\u00e9sum\u00e9 na\u00efve",
+        "\ufb01nance \ufb02ow",
+        "\uff26\uff55\uff4c\uff4c\uff57\uff49\uff44\uff54\uff48 \uff21\uff22\uff23\uff01",
+        "non\u00a0breaking\u2003em space",
+        "\u6771\u4eac \u0661\u0662\u0663 \u0627\u0644\u0639\u0631\u0628\u064a\u0629!",
+        "emoji \U0001f680 launch \U0001f1fa\U0001f1f8",
+        "\x1c\x1dfile\x1eseparators\x1f",
+        "",
+        "   ",
+        "!!!",
+    ])
+    def test_matches_reference(self, title):
+        assert normalize_title(title) == _reference_normalize(title)
+
 
 class TestArticleHash:
     def test_same_title_same_source(self):
@@ -77,6 +107,16 @@ class TestArticleCreate:
         assert article.language == "en"
         assert article.category == "general"
 
+    def test_parse_articles_batch(self):
+        rows = [
+            {"provider": "gdelt", "source": "Reuters", "title": "Story one", "url": "u1", "extra": 1},
+            {"provider": "gdelt", "source": "Reuters", "title": "Story two", "url": "u2"},
+        ]
+        articles = parse_articles(rows)
+        assert [a.title for a in articles] == ["Story one", "Story two"]
+        assert articles[0] == ArticleCreate(**rows[0])
+        assert articles[0].hash == make_article_hash("Story one", "Reuters")
+
 
 class TestAISummaryResponse:
     def test_valid_response(self):
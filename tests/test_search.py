@@ -0,0 +1,143 @@
+"""Tests for search ranking helpers."""
+
+import math
+import re
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from apps.api.services.search import (
+    _cluster_boost,
+    _cluster_boosts,
+    _combined_rank,
+    _recency_score,
+    _recency_scores,
+    _relevance_scorer,
+)
+
+
+def _reference_relevance(title: str, query: str) -> float:
+    """The original per-call _text_relevance, kept as the parity oracle."""
+    t = title.lower().strip()
+    q = query.lower().strip()
+    if not q:
+        return 0.0
+    if t == q:
+        return 1.0
+    if t.startswith(q):
+        return 0.9
+    query_words = q.split()
+    if not query_words:
+        return 0.0
+    title_words = re.findall(r"\w+", t)
+    boundary_matches = 0
+    substring_matches = 0
+    for qw in query_words:
+        if any(tw.startswith(qw) for tw in title_words):
+            boundary_matches += 1
+        elif qw in t:
+            substring_matches += 1
+    total_words = len(query_words)
+    if boundary_matches == total_words:
+        return 0.8
+    if boundary_matches + substring_matches == total_words:
+        return 0.6
+    if boundary_matches > 0:
+        return 0.2 + 0.2 * (boundary_matches / total_words)
+    if substring_matches > 0:
+        return 0.1 + 0.1 * (substring_matches / total_words)
+    return 0.0
+
+
+def _reference_recency(published_at: datetime | None, now: datetime) -> float:
+    """The original datetime-based _recency_score."""
+    if not published_at:
+        return 0.1
+    age_hours = max(0, (now - published_at).total_seconds()) / 3600
+    return max(0.05, math.exp(-0.029 * age_hours))
+
+
+TITLES = [
+    "Apple announces new AI features for iPhone",
+    "  Apple  ",
+    "apple",
+    "Pineapple prices soar",
+    "AI-powered chips: Nvidia's next_gen roadmap",
+    "snake_case titles_are words",
+    "Café owners protest in Zürich",
+    "ÉLECTIONS en France: résultats",
+    "東京 stocks rally after BOJ decision",
+    "Ｆｕｌｌｗｉｄｔｈ ＡＩ headline",
+    "Rocket 🚀 launch delayed",
+    "tabs\tand\nnewlines",
+    "",
+]
+
+QUERIES = [
+    "apple",
+    "Apple announces",
+    "apple ai iphone",
+    "pple",
+    "nvidia next",
+    "gen roadmap",
+    "_case",
+    "café",
+    "zürich protest",
+    "élections",
+    "東京",
+    "ｆｕｌｌ",
+    "🚀",
+    "rocket launch moon",
+    "tabs newlines",
+    "   ",
+    "",
+]
+
+
+class TestRelevanceScorer:
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_matches_reference(self, query):
+        score = _relevance_scorer(query)
+        for title in TITLES:
+            assert score(title) == pytest.approx(_reference_relevance(title, query)), title
+
+    def test_scorer_is_reusable(self):
+        score = _relevance_scorer("apple")
+        first = [score(t) for t in TITLES]
+        assert [score(t) for t in TITLES] == first
+
+
+class TestRecencyScore:
+    def test_matches_datetime_reference(self):
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for hours in [0, 0.5, 1, 24, 72, 24 * 7, 24 * 30, -5]:
+            published = now - timedelta(hours=hours)
+            assert _recency_score(published.timestamp(), now.timestamp()) == pytest.approx(
+                _reference_recency(published, now)
+            )
+        assert _recency_score(None, now.timestamp()) == _reference_recency(None, now)
+
+    def test_vectorized_matches_scalar(self):
+        now_ts = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+        pub = [now_ts, now_ts - 60, now_ts - 86400, now_ts - 86400 * 30, now_ts + 3600, None]
+        expected = [_recency_score(p, now_ts) for p in pub]
+        arr = np.array([np.nan if p is None else p for p in pub], dtype=np.float64)
+        np.testing.assert_allclose(_recency_scores(arr, now_ts), expected)
+
+
+class TestClusterBoost:
+    def test_vectorized_matches_scalar(self):
+        scores = [-3.0, 0.0, 0.5, 1.0, 10.0, 50.0, 51.0, 1000.0]
+        expected = [_cluster_boost(s) for s in scores]
+        np.testing.assert_allclose(_cluster_boosts(np.array(scores)), expected)
+
+    def test_matches_reference_scale(self):
+        for s in [1.0, 10.0, 49.0]:
+            assert _cluster_boost(s) == pytest.approx(math.log1p(s) / math.log1p(50))
+
+    def test_combined_rank_on_arrays(self):
+        rel = np.array([1.0, 0.6, 0.0])
+        rec = np.array([0.1, 1.0, 0.05])
+        boost = np.array([0.0, 0.5, 1.0])
+        expected = [_combined_rank(*t) for t in zip(rel, rec, boost)]
+        np.testing.assert_allclose(_combined_rank(rel, rec, boost), expected)
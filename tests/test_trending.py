@@ -51,3 +51,45 @@ class TestTrendingScore:
             velocity=15,
         )
         assert score > 10
+
+    def test_integer_inputs_match_natural_log(self):
+        """Integer inputs score with the natural log1p."""
+        import math
+        from packages.shared.constants import TRENDING_W_RECENCY, TRENDING_W_SOURCES, TRENDING_W_VELOCITY
+
+        for n in (0, 1, 7, 255, 256, 1000):
+            expected = round(
+                TRENDING_W_SOURCES * math.log(1 + n)
+                + TRENDING_W_RECENCY * 1.0
+                + TRENDING_W_VELOCITY * math.log(1 + n),
+                4,
+            )
+            assert compute_trending_score(n, 0, n) == expected
+
+    def test_batch_scores_match_reference_formula(self):
+        """The vectorized scorer reproduces the original per-cluster formula."""
+        import math
+        import numpy as np
+        from apps.api.services.trending import compute_trending_scores
+        from packages.shared.constants import TRENDING_W_RECENCY, TRENDING_W_SOURCES, TRENDING_W_VELOCITY
+
+        def reference(unique_sources, age_minutes, velocity):
+            recency = 1.0 if age_minutes <= 0 else 1.0 / (1.0 + age_minutes / 60.0)
+            return round(
+                TRENDING_W_SOURCES * math.log(1 + unique_sources)
+                + TRENDING_W_RECENCY * recency
+                + TRENDING_W_VELOCITY * math.log(1 + velocity),
+                4,
+            )
+
+        sources = [0, 1, 3, 12, 40, 255, 256]
+        ages = [-5, 0, 2, 90.5, 1440, 10000, 0.001]
+        velocity = [0, 15, 3, 200, 0, 1, 1000]
+        batch = compute_trending_scores(np.array(sources), np.array(ages), np.array(velocity))
+        assert batch.tolist() == [reference(s, a, v) for s, a, v in zip(sources, ages, velocity)]
+
+    def test_known_scores(self):
+        # 3*ln(4) + 2/(1 + 30/60) + 1.5*ln(3) = 4.1589 + 1.3333 + 1.6479
+        assert compute_trending_score(3, 30, 2) == pytest.approx(7.1401, abs=1e-4)
+        # Fresh single-source story, no velocity: 3*ln(2) + 2
+        assert compute_trending_score(1, 0, 0) == pytest.approx(4.0794, abs=1e-4)